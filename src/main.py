@@ -14,8 +14,6 @@ except ImportError:
     pass
 
 from src.utils.logging import setup_logging, debug_print
-from src.utils.file_handling import validate_subscriber_file
-from src.config.settings import EXPECTED_COLUMNS
 
 
 def parse_args():
@@ -32,6 +30,9 @@ def main():
     args = parse_args()
     setup_logging()
 
+    # Deferred so --help and argument errors exit without loading pandas/openpyxl
+    from src.utils.file_handling import validate_subscriber_file
+
     debug_print(f"Starting validation for {args.input_csv} with company_id={args.company_id}, period={args.period}")
 
     try:
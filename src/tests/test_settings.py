@@ -0,0 +1,53 @@
+"""Tests for the regex engine selection in src.config.settings."""
+
+import re
+import unittest
+
+from src.config import settings
+from src.config.settings import compile_linear_pattern, SPECIFIC_ROAD_PATTERN, STREET_ENDINGS
+
+# ASCII and non-ASCII inputs; the non-ASCII ones exercise \b, \s and \d, which RE2 treats as ASCII-only
+ENGINE_PARITY_INPUTS = [
+    "123 MAIN ST",
+    "99 HWY 12",
+    "99 HWY ١٢",  # Arabic-Indic digits
+    "12 COUNTY ROAD 140",
+    "12 FARM TO MARKET 1960",
+    "123 ÉLAN",
+    "12 ÑANDU",
+    "77 ÖSTER",
+    "77 ÖSTER\u00a0ST",  # no-break space
+    "55 CAFÉ RD",
+    "",
+]
+
+
+class CompileLinearPatternTests(unittest.TestCase):
+    def assert_same_matches(self, pattern):
+        compiled = compile_linear_pattern(pattern)
+        reference = re.compile(pattern, re.IGNORECASE)
+        for text in ENGINE_PARITY_INPUTS:
+            with self.subTest(pattern=pattern[:40], text=text):
+                self.assertEqual(bool(compiled.search(text)), bool(reference.search(text)))
+
+    def test_road_patterns_match_like_stdlib(self):
+        self.assert_same_matches(SPECIFIC_ROAD_PATTERN)
+        self.assert_same_matches(STREET_ENDINGS)
+
+    def test_unicode_sensitive_patterns_use_stdlib(self):
+        for pattern in (r"\bHWY\b", r"HWY\s*\d+", r"\w+ RD", r"ST$", SPECIFIC_ROAD_PATTERN, STREET_ENDINGS):
+            with self.subTest(pattern=pattern[:40]):
+                self.assertIsInstance(compile_linear_pattern(pattern), re.Pattern)
+
+    def test_specific_road_pattern_accepts_non_ascii_digits(self):
+        self.assertTrue(settings.SPECIFIC_ROAD_PATTERN_RE.search("99 HWY ١٢"))
+
+    @unittest.skipIf(settings.re2 is None, "google-re2 is not installed")
+    def test_re2_eligible_pattern_matches_like_stdlib(self):
+        pattern = r"(?:County (?:Road|Rd)|Farm to Market|Private Road)"
+        self.assertNotIsInstance(compile_linear_pattern(pattern), re.Pattern)
+        self.assert_same_matches(pattern)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,24 +2,21 @@
 
 import os
 import sys
-import re
 import shutil
+import functools
 import csv
+import io
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import time
 import json
+import threading
 import traceback
-import openpyxl
-from openpyxl.styles import PatternFill
 from src.utils.logging import debug_print
-from src.config.settings import EXPECTED_COLUMNS, VALID_STATES, VALID_TECHNOLOGIES, STATE_LAT_RANGES, STATE_LON_RANGES, DTYPE_DICT, GREEN_FILL, PINK_FILL, YELLOW_FILL, RED_FILL
-from src.validation.customer import validate_customer_uniqueness, remove_full_row_duplicates
-from src.validation.address import validate_address, validate_address_column
-from src.validation.general import validate_general_columns, validate_and_correct_state
-from src.validation.coordinates import validate_coordinates
-from src.validation.smarty_validation import process_smarty_corrections
+from src.config.settings import EXPECTED_COLUMNS, EXPECTED_COLUMN_STR_DTYPES, is_known_column, VALID_STATES, VALID_TECHNOLOGIES, STATE_LAT_RANGES, STATE_LON_RANGES, DTYPE_DICT, ZIP_CODE_RE, FARM_TO_MARKET_RE, COUNTY_ROAD_RE, PRIVATE_ROAD_RE, ADDRESS_PATTERN_CANDIDATE_RE
+# openpyxl, the fills and the src.validation modules are imported where they are used, so
+# callers that only need the CSV helpers (e.g. reporting's save_csv) do not load them
 
 def detect_and_clean_nul_characters(input_csv, company_id, base_filename):
     """
@@ -183,11 +180,13 @@ def create_column_count_error_excel(all_rows_data, error_rows, output_path, expe
         output_path: where to save the Excel file
         expected_column_count: number of columns that should be in each row
     """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import PatternFill
     try:
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Column Count Errors"
+        # Create workbook (write-only: rows are streamed out as they are appended)
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Column Count Errors")
 
         # Define red fill for error rows
         red_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
@@ -195,42 +194,38 @@ def create_column_count_error_excel(all_rows_data, error_rows, output_path, expe
         # Create set of error row numbers for quick lookup (adjust for header)
         error_row_nums = {err["row_num"] for err in error_rows}
 
+        # Pad or truncate data rows to match expected column count
+        header = all_rows_data[0] if all_rows_data else []
+        data_rows = [row_data[:expected_column_count] + [''] * max(0, expected_column_count - len(row_data))
+                     for row_data in all_rows_data[1:]]
+
+        # Auto-size columns (a write-only sheet needs widths before any row is written)
+        column_count = max(len(header), expected_column_count if data_rows else 0)
+        max_lengths = [0] * column_count
+        for row in [header] + data_rows:
+            for col_idx, value in enumerate(row):
+                if value:
+                    max_lengths[col_idx] = max(max_lengths[col_idx], len(str(value)))
+        for col_idx, max_length in enumerate(max_lengths, start=1):
+            adjusted_width = min(max_length + 2, 50)  # Cap at 50
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = adjusted_width
+
         # Write header
         if all_rows_data:
-            header = all_rows_data[0]
-            for col_idx, value in enumerate(header, start=1):
-                ws.cell(row=1, column=col_idx, value=value)
-
-        # Write all data rows
-        excel_row = 2  # Start after header
-        csv_row_num = 2  # Track actual CSV row number (1-indexed, accounting for header)
-
-        for row_data in all_rows_data[1:]:  # Skip header in data
-            # Pad or truncate row to match expected column count
-            normalized_row = row_data[:expected_column_count] + [''] * max(0, expected_column_count - len(row_data))
-
-            for col_idx, value in enumerate(normalized_row, start=1):
-                cell = ws.cell(row=excel_row, column=col_idx, value=value)
-
-                # Highlight entire row if it's an error row
-                if csv_row_num in error_row_nums:
+            ws.append(header)
+
+        # Write all data rows, highlighting entire error rows
+        # CSV row numbers are 1-indexed and the header is row 1
+        for csv_row_num, normalized_row in enumerate(data_rows, start=2):
+            if csv_row_num in error_row_nums:
+                cells = []
+                for value in normalized_row:
+                    cell = WriteOnlyCell(ws, value=value)
                     cell.fill = red_fill
-
-            excel_row += 1
-            csv_row_num += 1
-
-        # Auto-size columns
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            ws.column_dimensions[column_letter].width = adjusted_width
+                    cells.append(cell)
+                ws.append(cells)
+            else:
+                ws.append(normalized_row)
 
         # Save workbook
         wb.save(output_path)
@@ -244,26 +239,22 @@ def create_column_count_error_excel(all_rows_data, error_rows, output_path, expe
 
 def normalize_column_names(df, errors):
     """Normalize column names using common variations mapping."""
-    from src.config.settings import COLUMN_NAME_MAPPING
+    from src.config.settings import normalize_column_name
     
     renamed_columns = []
     original_columns = list(df.columns)
     
-    # Create case-insensitive mapping
-    mapping_lower = {k.lower().strip(): v for k, v in COLUMN_NAME_MAPPING.items()}
-    
     # Check for conflicts (both correct and variation exist)
-    input_columns_lower = [col.lower().strip() for col in df.columns]
+    existing_columns = set(df.columns)
     conflicts_resolved = []
     
     # Find columns to rename
     columns_to_rename = {}
     for col in df.columns:
-        col_lower = col.lower().strip()
-        if col_lower in mapping_lower:
-            target_column = mapping_lower[col_lower]
+        target_column = normalize_column_name(col)
+        if target_column != col:
             # Check if target already exists (prefer existing correct name)
-            if target_column not in [col for col in df.columns]:
+            if target_column not in existing_columns:
                 columns_to_rename[col] = target_column
             else:
                 conflicts_resolved.append(f"Kept existing '{target_column}' column, ignored '{col}'")
@@ -283,13 +274,45 @@ def normalize_column_names(df, errors):
     
     return df, renamed_columns, conflicts_resolved
 
+def read_sample_rows(input_csv, encoding, max_rows):
+    """
+    Read the first rows of a CSV as lists of strings for header detection.
+
+    Follows pd.read_csv(header=None, nrows=max_rows, keep_default_na=False) without starting the
+    pandas parser: blank lines are skipped, short rows are padded with "", a row with more fields
+    than the first raises ValueError, and only the bytes of the rows read are decoded, so
+    UnicodeDecodeError is raised in the same cases.
+
+    Returns:
+        list: Up to max_rows rows, each a list of field strings
+    """
+    def decoded_lines(f):
+        for line_num, raw_line in enumerate(f):
+            text = raw_line.decode(encoding)
+            if line_num == 0 and text.startswith('\ufeff'):
+                text = text[1:]
+            # A raw line may still hold bare \r line breaks; let csv see them as separate lines
+            yield from io.StringIO(text, newline='')
+
+    rows = []
+    with open(input_csv, 'rb') as f:
+        for row in csv.reader(decoded_lines(f)):
+            if not row or (len(row) == 1 and not row[0].strip()):
+                continue
+            if rows and len(row) > len(rows[0]):
+                raise ValueError(f"Expected {len(rows[0])} fields in row {len(rows) + 1}, saw {len(row)}")
+            rows.append(row)
+            if len(rows) == max_rows:
+                break
+    width = len(rows[0]) if rows else 0
+    return [row + [""] * (width - len(row)) for row in rows]
+
 def find_header_row(input_csv):
     """
     Find the actual header row in a CSV file by scanning the first few rows.
     Returns the row number where headers are found, or None if not found.
     """
-    from src.config.settings import EXPECTED_COLUMNS
-    import pandas as pd
+    from src.config.settings import EXPECTED_COLUMNS, normalize_column_name
     
     MAX_ROWS_TO_CHECK = 7
     
@@ -297,12 +320,12 @@ def find_header_row(input_csv):
     
     try:
         # Read first few rows without assuming header location
-        sample_df = pd.read_csv(input_csv, nrows=MAX_ROWS_TO_CHECK, header=None, encoding='utf-8', keep_default_na=False)
-        debug_print(f"Read {len(sample_df)} sample rows for header detection")
+        sample_rows = read_sample_rows(input_csv, 'utf-8', MAX_ROWS_TO_CHECK)
+        debug_print(f"Read {len(sample_rows)} sample rows for header detection")
     except UnicodeDecodeError:
         try:
-            sample_df = pd.read_csv(input_csv, nrows=MAX_ROWS_TO_CHECK, header=None, encoding='latin1', keep_default_na=False)
-            debug_print(f"Read {len(sample_df)} sample rows with latin1 encoding")
+            sample_rows = read_sample_rows(input_csv, 'latin1', MAX_ROWS_TO_CHECK)
+            debug_print(f"Read {len(sample_rows)} sample rows with latin1 encoding")
         except Exception as e:
             debug_print(f"Failed to read sample rows: {str(e)}")
             return None
@@ -311,56 +334,146 @@ def find_header_row(input_csv):
         return None
     
     # Check each row to see if it could be the header
-    for row_idx in range(len(sample_df)):
-        potential_headers = sample_df.iloc[row_idx].astype(str).str.strip().tolist()
+    for row_idx, row in enumerate(sample_rows):
+        potential_headers = [value.strip() for value in row]
         debug_print(f"Checking row {row_idx}: {potential_headers[:5]}...")  # Show first 5 columns
         
-        # Create a temporary DataFrame to test column normalization
-        temp_df = pd.DataFrame([potential_headers]).T.reset_index()
-        temp_df.columns = ['temp_col_' + str(i) for i in range(len(temp_df.columns))]
-        temp_df = temp_df.T
-        temp_df.columns = potential_headers
-        
-        # Apply column normalization (same logic as main process)
-        try:
-            normalized_df, renamed_columns, conflicts_resolved = normalize_column_names(temp_df, [])
-            
-            # Check if all expected columns are present after normalization
-            normalized_columns = [col.lower().strip() for col in normalized_df.columns]
-            expected_columns_lower = [col.lower() for col in EXPECTED_COLUMNS]
-            
-            missing_columns = [col for col in expected_columns_lower if col not in normalized_columns]
-            
-            if not missing_columns:
-                # Found complete header row!
-                debug_print(f"✅ Header row found at row {row_idx}")
-                debug_print(f"Original headers: {potential_headers}")
-                if renamed_columns:
-                    debug_print(f"Column renames that will be applied: {renamed_columns}")
-                if conflicts_resolved:
-                    debug_print(f"Column conflicts resolved: {conflicts_resolved}")
-                return row_idx
-            else:
-                debug_print(f"❌ Row {row_idx} missing columns: {missing_columns}")
-                
-        except Exception as e:
-            debug_print(f"❌ Row {row_idx} failed normalization test: {str(e)}")
-            continue
+        # Apply the same name mapping as normalize_column_names, without building a DataFrame.
+        # A variation whose standard name is already present is kept as-is, but the standard name
+        # is then in the set anyway, so mapping every header gives the same coverage.
+        normalized_columns = {normalize_column_name(col).lower().strip() for col in potential_headers}
+        missing_columns = [col for col in EXPECTED_COLUMNS if col not in normalized_columns]
+
+        if not missing_columns:
+            # Found complete header row!
+            debug_print(f"✅ Header row found at row {row_idx}")
+            debug_print(f"Original headers: {potential_headers}")
+            header_set = set(potential_headers)
+            renamed_columns = [f"'{col}' → '{normalize_column_name(col)}'" for col in potential_headers
+                               if normalize_column_name(col) != col and normalize_column_name(col) not in header_set]
+            if renamed_columns:
+                debug_print(f"Column renames that will be applied: {renamed_columns}")
+            return row_idx
+        else:
+            debug_print(f"❌ Row {row_idx} missing columns: {missing_columns}")
     
     # No valid header row found
     debug_print(f"❌ No valid header row found in first {MAX_ROWS_TO_CHECK} rows")
     return None
 
-def save_csv(df, path, errors, header_comment="# the python version is 1.3.0.2\n"):
-    """Save DataFrame to CSV with header comment."""
+def read_csv_with_pyarrow(csv_path, encoding, skiprows):
+    """
+    Read a subscriber CSV with pyarrow's multi-threaded parser.
+
+    Only used when the header row holds exactly the EXPECTED_COLUMNS names once each (no name
+    variations); every kept column is then read as text, so no type inference is involved and
+    the result matches the pandas reader. Expects NUL characters to have been removed already
+    (detect_and_clean_nul_characters), since pandas stops a field at NUL and pyarrow does not.
+
+    Returns:
+        pd.DataFrame or None: The expected columns as object-dtype strings, or None when pyarrow
+            is unavailable, the header needs normalization, or pyarrow rejects the file
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        # pyarrow not installed, use the pandas reader
+        return None
+
+    skip_rows = len(skiprows) if skiprows else 0
     try:
-        with open(path, 'w', encoding='utf-8') as f:
+        with open(csv_path, newline='', encoding=encoding) as f:
+            reader = csv.reader(f)
+            for _ in range(skip_rows):
+                next(reader)
+            header = next(reader)
+    except (StopIteration, UnicodeDecodeError, csv.Error):
+        return None
+
+    if sorted(col for col in header if is_known_column(col)) != sorted(EXPECTED_COLUMNS):
+        return None
+
+    try:
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(skip_rows=skip_rows, encoding=encoding),
+            parse_options=pacsv.ParseOptions(delimiter=",", newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: pa.string() for col in EXPECTED_COLUMNS},
+                include_columns=EXPECTED_COLUMNS,
+                strings_can_be_null=False
+            )
+        )
+    except (pa.ArrowException, UnicodeDecodeError) as e:
+        debug_print(f"pyarrow could not read {csv_path}, using pandas reader: {str(e)}")
+        return None
+    return table.to_pandas()
+
+
+def read_subscriber_csv(csv_path, encoding, skiprows):
+    """
+    Read the subscriber CSV, preferring pyarrow and falling back to pandas.
+
+    The pandas reader parses only expected columns and their known name variations (anything
+    else is dropped later anyway) and raises UnicodeDecodeError as before for the caller's
+    latin1 retry.
+    """
+    df = read_csv_with_pyarrow(csv_path, encoding, skiprows)
+    if df is not None:
+        debug_print(f"Read {csv_path} with pyarrow")
+        return df
+    return pd.read_csv(csv_path, dtype=EXPECTED_COLUMN_STR_DTYPES, encoding=encoding, keep_default_na=False, sep=',', skiprows=skiprows, usecols=is_known_column, memory_map=True)
+
+
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_dict_rows(f, rows):
+    """
+    Write a list of dicts as CSV with csv.DictWriter.
+
+    Columns are the union of the row keys in first-seen order; missing keys and None/NaN/NA
+    values are written as empty fields. Values are written as-is, so unlike
+    pd.DataFrame(rows).to_csv(index=False) an int column with a missing value is not upcast
+    to float: [{"Row": 5}, {"Row": None}] gives "5", where pandas writes "5.0".
+    """
+    fieldnames = dict.fromkeys(key for row in rows for key in row)
+    if not fieldnames:
+        f.write("\n")
+        return
+    writer = csv.DictWriter(f, fieldnames=list(fieldnames), restval="", lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(
+        {key: "" if value is None or value is pd.NA or (isinstance(value, float) and value != value) else value
+         for key, value in row.items()}
+        for row in rows
+    )
+
+
+def save_csv(df, path, errors, header_comment="# the python version is 1.3.0.2\n", durable=False):
+    """
+    Save DataFrame to CSV with header comment.
+
+    df may also be a list of dicts (e.g. the error lists), which is written with csv.DictWriter
+    rather than building a DataFrame first.
+
+    Outputs can be regenerated by re-running validation, so the file is only fsync'd to disk
+    when durable=True.
+    """
+    try:
+        # 1 MiB buffer instead of the 8 KiB default so to_csv's many small writes are batched
+        with open(path, 'w', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE) as f:
             f.write(header_comment)
-            df.to_csv(f, index=False)
-            f.flush()  # Ensure data is written to OS buffer
-            os.fsync(f.fileno())  # Force write to disk
+            if isinstance(df, list):
+                write_dict_rows(f, df)
+            else:
+                df.to_csv(f, index=False)
+            if durable:
+                f.flush()  # Ensure data is written to OS buffer
+                os.fsync(f.fileno())  # Force write to disk
         if os.path.isfile(path):
-            debug_print(f"Successfully saved and synced to disk: {path}")
+            debug_print(f"Successfully saved{' and synced to disk' if durable else ''}: {path}")
             return path
         else:
             errors.append({
@@ -382,6 +495,31 @@ def save_csv(df, path, errors, header_comment="# the python version is 1.3.0.2\n
         return None
 
 
+def copy_input_file(src, dst):
+    """
+    Copy the input CSV into the validation directory.
+
+    Uses os.copy_file_range where available, which copies inside the kernel and shares extents
+    (reflink) on copy-on-write filesystems such as XFS and Btrfs; falls back to shutil.copyfile.
+    The archived copy stays independent of the source, unlike a hardlink.
+    """
+    if hasattr(os, "copy_file_range") and not os.path.exists(dst):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError as e:
+            # e.g. cross-device copy on older kernels - use a regular copy
+            debug_print(f"copy_file_range failed for {src}, using shutil.copyfile: {str(e)}")
+    shutil.copyfile(src, dst)
+
+# The same (message, column) pairs recur across every flagged cell, so results are memoized
+@functools.lru_cache(maxsize=1024)
 def get_error_priority_and_fill(error_msg, col_name):
     """
     Centralized function to determine error priority and corresponding Excel fill color.
@@ -395,6 +533,7 @@ def get_error_priority_and_fill(error_msg, col_name):
             priority_level: 1=RED (highest), 2=PINK (medium), 3=YELLOW (lowest)
             fill_color: The corresponding PatternFill object
     """
+    from src.config.settings import RED_FILL, PINK_FILL, YELLOW_FILL
     # RED (Priority 1) - Critical errors that must be fixed
     if (error_msg.startswith("Required field:") or
         error_msg == "Address lacks leading number followed by street name" or
@@ -417,199 +556,359 @@ def get_error_priority_and_fill(error_msg, col_name):
         return (3, YELLOW_FILL)
 
 
+# Columns type-checked before writing the corrected Excel file, in per-row check order
+EXCEL_TYPED_COLUMNS = ["zip", "download", "upload", "voip_lines_quantity", "business_customer"]
+
+
+def is_blank(series):
+    """Return a boolean mask of NA or whitespace-only values."""
+    return series.isna() | series.astype(str).str.strip().eq("")
+
+
+def has_comma(series):
+    """Return a boolean array marking non-NA values whose text contains a comma."""
+    return (series.notna() & series.astype(str).str.contains(",", regex=False)).to_numpy()
+
+
+def is_plain_text(series):
+    """Return True if the series is object dtype with no missing values, i.e. read as text."""
+    return series.dtype == object and not series.isna().any()
+
+
+def flag_message(cell_data):
+    """Return the error message of a flagged_cells entry (either error_msg or (error_msg, orig_row))."""
+    return cell_data[0] if type(cell_data) is tuple else cell_data
+
+
+def is_required_field_flag(cell_data):
+    """Return True if a flagged_cells entry is a "Required field:" error."""
+    message = flag_message(cell_data)
+    return isinstance(message, str) and message.startswith("Required field:")
+
+
+def remove_commas(cleaned_df, col, correction_type, label, orig_rows, corrected_cells):
+    """
+    Strip commas from a column in place and record a correction for each changed cell.
+
+    The column is only rewritten when some value has a comma or it is not already plain text
+    (astype(str) would still change it); otherwise it is left untouched.
+
+    Args:
+        cleaned_df (pd.DataFrame): Data being cleaned, with a 0..n-1 RangeIndex
+        col (str): Column to clean
+        correction_type (str): "type" recorded in corrected_cells
+        label (str): How the column is named in the debug log
+        orig_rows (np.ndarray): OrigRowNum per position
+        corrected_cells (dict): Corrections keyed by (idx, col)
+    """
+    comma_rows = np.flatnonzero(has_comma(cleaned_df[col]))
+    original_values = cleaned_df[col].iloc[comma_rows].tolist()
+    if len(comma_rows) or not is_plain_text(cleaned_df[col]):
+        cleaned_df[col] = cleaned_df[col].astype(str).str.replace(',', '', regex=False)
+
+    # Track corrections for values where commas were removed
+    cleaned_values = cleaned_df[col].iloc[comma_rows].tolist()
+    for idx, original, cleaned in zip(comma_rows, original_values, cleaned_values):
+        corrected_cells[(int(idx), col)] = {
+            "row": int(orig_rows[idx]),
+            "original": str(original),
+            "corrected": str(cleaned),
+            "type": correction_type,
+            "status": "Valid"
+        }
+        debug_print(f"Removed comma from {label} for OrigRowNum={orig_rows[idx]}: '{original}' -> '{cleaned}'")
+
+def get_excel_cells_to_convert(sorted_df):
+    """
+    Find the cells save_excel has to convert or reject, using column-wise masks.
+
+    Numeric columns that already have a numeric dtype convert to themselves and are skipped;
+    object columns (mixed values left by validation) are checked cell by cell.
+
+    Args:
+        sorted_df (pd.DataFrame): Data about to be written, with a 0..n-1 RangeIndex
+
+    Returns:
+        list: (row_idx, column) pairs in row-major order
+    """
+    cells = []
+    for col_pos, col in enumerate(EXCEL_TYPED_COLUMNS):
+        values = sorted_df[col]
+        present = values.notna()
+        if col == "zip":
+            # Skip ZIP validation for GPS-only rows (all address fields empty)
+            gps_only = (is_blank(sorted_df["address"]) & is_blank(sorted_df["city"]) &
+                        is_blank(sorted_df["state"]) & is_blank(values))
+            for orig_row in sorted_df.loc[present & gps_only, "OrigRowNum"]:
+                debug_print(f"save_excel: Skipping ZIP validation for OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
+            valid_zip = values.astype(str).str.match(ZIP_CODE_RE).to_numpy(dtype=bool, na_value=False)
+            mask = present & ~gps_only & ~valid_zip
+        elif pd.api.types.is_float_dtype(values) and col in ["download", "upload"]:
+            continue
+        elif pd.api.types.is_integer_dtype(values) and col == "voip_lines_quantity":
+            continue
+        elif pd.api.types.is_integer_dtype(values) and col == "business_customer":
+            mask = present & ~values.isin([0, 1])
+        else:
+            mask = present
+        cells.extend((idx, col_pos) for idx in np.flatnonzero(mask.to_numpy()))
+    cells.sort()
+    return [(int(idx), EXCEL_TYPED_COLUMNS[col_pos]) for idx, col_pos in cells]
+
+def excel_cell_values(series):
+    """
+    Return a column's values as the Python scalars pandas' to_excel would write.
+
+    Numbers and bools become Python int/float/bool, infinities become "inf"/"-inf" and any
+    other non-string object is written as its str().
+    """
+    values = series.tolist()
+    if series.dtype == object:
+        return [value if type(value) is str else excel_cell_value(value) for value in values]
+    if series.dtype.kind == "f" and np.isinf(series.to_numpy()).any():
+        return [excel_cell_value(value) for value in values]
+    return values
+
+
+def excel_cell_value(value):
+    """Convert one cell value the way pandas' to_excel does (see excel_cell_values)."""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        if value == np.inf:
+            return "inf"
+        if value == -np.inf:
+            return "-inf"
+        return float(value)
+    return str(value)
+
+
 def save_excel(df, path, errors, corrected_cells, flagged_cells, rows_to_exclude=None):
     """Save DataFrame to Excel with cell coloring."""
+    from src.config.settings import GREEN_FILL
     try:
         # Filter out excluded rows at the very beginning
-        if rows_to_exclude:
-            original_len = len(df)
-            df = df[~df["OrigRowNum"].isin(rows_to_exclude)].reset_index(drop=True)
-            debug_print(f"Filtered out {original_len - len(df)} rows from Excel output. Remaining: {len(df)} rows")
-        
         # Keep DataFrame in original order - OrigRowNum should already be sequential
-        sorted_df = df.copy().reset_index(drop=True)
-        sorted_df["OrigRowNum"] = sorted_df["OrigRowNum"].astype(int)
-        sorted_df["zip"] = sorted_df["zip"].astype("string")
+        # reset_index returns a new frame, so the caller's DataFrame is not modified below
+        if rows_to_exclude is not None and len(rows_to_exclude):
+            exclude_rows = np.fromiter(rows_to_exclude, dtype=np.int64, count=len(rows_to_exclude))
+            sorted_df = df[~np.isin(df["OrigRowNum"].to_numpy(), exclude_rows)].reset_index(drop=True)
+            debug_print(f"Filtered out {len(df) - len(sorted_df)} rows from Excel output. Remaining: {len(sorted_df)} rows")
+        else:
+            sorted_df = df.reset_index(drop=True)
+        sorted_df["OrigRowNum"] = sorted_df["OrigRowNum"].astype(int, copy=False)
+        sorted_df["zip"] = sorted_df["zip"].astype("string", copy=False)
 
         # Validate and convert data types
-        for idx, row in sorted_df.iterrows():
-            orig_row = row["OrigRowNum"]
-            for col in ["zip", "download", "upload", "voip_lines_quantity", "business_customer"]:
-                val = row[col]
-                if pd.notna(val):
-                    try:
-                        if col == "zip":
-                            # Check if this is a GPS-only row (all address fields empty)
-                            row_address = row.get('address', '')
-                            row_city = row.get('city', '')
-                            row_state = row.get('state', '')
-                            row_zip = row.get('zip', '')
-
-                            address_empty = pd.isna(row_address) or str(row_address).strip() == ""
-                            city_empty = pd.isna(row_city) or str(row_city).strip() == ""
-                            state_empty = pd.isna(row_state) or str(row_state).strip() == ""
-                            zip_empty = pd.isna(row_zip) or str(row_zip).strip() == ""
-
-                            # Skip ZIP validation for GPS-only rows
-                            if address_empty and city_empty and state_empty and zip_empty:
-                                debug_print(f"save_excel: Skipping ZIP validation for OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
-                                continue
-
-                            if not re.match(r"^\d{5}(-\d{4})?$", str(val)):
-                                sorted_df.loc[idx, col] = pd.NA
-                                errors.append({
-                                    "Row": orig_row,
-                                    "Column": col,
-                                    "Error": "Invalid ZIP code",
-                                    "Value": val
-                                })
-                                corrected_cells[(idx, col)] = {
-                                    "row": int(sorted_df["OrigRowNum"].iloc[idx]),
-                                    "original": val,
-                                    "corrected": None,
-                                    "type": "Invalid ZIP Replacement",
-                                    "status": "Valid"
-                                }
-                        elif col in ["download", "upload"]:
-                            float_val = float(val)
-                            sorted_df.loc[idx, col] = float_val
-                            if str(val) != str(float_val):
-                                corrected_cells[(idx, col)] = {
-                                    "row": int(sorted_df["OrigRowNum"].iloc[idx]),
-                                    "original": val,
-                                    "corrected": float_val,
-                                    "type": f"{col.capitalize()} Format Conversion",
-                                    "status": "Valid"
-                                }
-                        elif col == "voip_lines_quantity":
-                            int_val = int(float(val))
-                            sorted_df.loc[idx, col] = int_val
-                            if str(val) != str(int_val):
-                                corrected_cells[(idx, col)] = {
-                                    "row": int(sorted_df["OrigRowNum"].iloc[idx]),
-                                    "original": val,
-                                    "corrected": int_val,
-                                    "type": "VoIP Lines Format Conversion",
-                                    "status": "Valid"
-                                }
-                        elif col == "business_customer":
-                            int_val = int(val)
-                            if int_val not in [0, 1]:
-                                sorted_df.loc[idx, col] = pd.NA
-                                errors.append({
-                                    "Row": orig_row,
-                                    "Column": col,
-                                    "Error": "Business customer must be 0 or 1",
-                                    "Value": val
-                                })
-                                corrected_cells[(idx, col)] = {
-                                    "row": int(sorted_df["OrigRowNum"].iloc[idx]),
-                                    "original": val,
-                                    "corrected": None,
-                                    "type": "Invalid Business Customer Replacement",
-                                    "status": "Valid"
-                                }
-                            else:
-                                sorted_df.loc[idx, col] = int_val
-                    except (ValueError, TypeError) as e:
+        # Cells that cannot change are screened out column-wise first; the rest go through the
+        # per-cell conversion in row-major order so errors and corrections are recorded as before
+        # Errors and corrections are collected locally and merged once after the loop
+        orig_rows = sorted_df["OrigRowNum"].tolist()
+        new_errors = []
+        new_corrections = {}
+        col_values = {col: sorted_df[col].tolist() for col in EXCEL_TYPED_COLUMNS}
+        for idx, col in get_excel_cells_to_convert(sorted_df):
+            val = col_values[col][idx]
+            orig_row = orig_rows[idx]
+            try:
+                if col == "zip":
+                    sorted_df.loc[idx, col] = pd.NA
+                    new_errors.append({
+                        "Row": orig_row,
+                        "Column": col,
+                        "Error": "Invalid ZIP code",
+                        "Value": val
+                    })
+                    new_corrections[(idx, col)] = {
+                        "row": orig_row,
+                        "original": val,
+                        "corrected": None,
+                        "type": "Invalid ZIP Replacement",
+                        "status": "Valid"
+                    }
+                elif col in ["download", "upload"]:
+                    float_val = float(val)
+                    sorted_df.loc[idx, col] = float_val
+                    if str(val) != str(float_val):
+                        new_corrections[(idx, col)] = {
+                            "row": orig_row,
+                            "original": val,
+                            "corrected": float_val,
+                            "type": f"{col.capitalize()} Format Conversion",
+                            "status": "Valid"
+                        }
+                elif col == "voip_lines_quantity":
+                    int_val = int(float(val))
+                    sorted_df.loc[idx, col] = int_val
+                    if str(val) != str(int_val):
+                        new_corrections[(idx, col)] = {
+                            "row": orig_row,
+                            "original": val,
+                            "corrected": int_val,
+                            "type": "VoIP Lines Format Conversion",
+                            "status": "Valid"
+                        }
+                elif col == "business_customer":
+                    int_val = int(val)
+                    if int_val not in [0, 1]:
                         sorted_df.loc[idx, col] = pd.NA
-                        errors.append({
+                        new_errors.append({
                             "Row": orig_row,
                             "Column": col,
-                            "Error": f"Invalid {col} value: {str(e)}",
+                            "Error": "Business customer must be 0 or 1",
                             "Value": val
                         })
-                        corrected_cells[(idx, col)] = {
-                            "row": int(sorted_df["OrigRowNum"].iloc[idx]),
+                        new_corrections[(idx, col)] = {
+                            "row": orig_row,
                             "original": val,
                             "corrected": None,
-                            "type": f"Invalid {col.capitalize()} Replacement",
+                            "type": "Invalid Business Customer Replacement",
                             "status": "Valid"
                         }
+                    else:
+                        sorted_df.loc[idx, col] = int_val
+            except (ValueError, TypeError) as e:
+                sorted_df.loc[idx, col] = pd.NA
+                new_errors.append({
+                    "Row": orig_row,
+                    "Column": col,
+                    "Error": f"Invalid {col} value: {str(e)}",
+                    "Value": val
+                })
+                new_corrections[(idx, col)] = {
+                    "row": orig_row,
+                    "original": val,
+                    "corrected": None,
+                    "type": f"Invalid {col.capitalize()} Replacement",
+                    "status": "Valid"
+                }
+        errors.extend(new_errors)
+        corrected_cells.update(new_corrections)
 
         # Create mapping from OrigRowNum to Excel row number
-        orig_row_to_excel_row = {row["OrigRowNum"]: i + 2 for i, row in sorted_df.iterrows()}
+        orig_row_to_excel_row = dict(zip(sorted_df["OrigRowNum"].tolist(), range(2, len(sorted_df) + 2)))
         
-        with pd.ExcelWriter(path, engine="openpyxl") as writer:
-            sorted_df.to_excel(writer, sheet_name="Corrected Data", index=False)
-            wb = writer.book
-            ws = wb["Corrected Data"]
-            col_map = {col: idx + 1 for idx, col in enumerate(sorted_df.columns)}
-
-            for idx, row in sorted_df.iterrows():
-                excel_row = idx + 2
-                for col, val in row.items():
-                    excel_col = openpyxl.utils.get_column_letter(col_map[col])
-                    cell = ws[f"{excel_col}{excel_row}"]
-                    cell.value = "" if pd.isna(val) else val
-                    if col == "voip_lines_quantity":
-                        cell.number_format = "0"
-
-            # Track which cells have been filled and their priority levels
-            cell_fills = {}  # {(excel_row, excel_col): (priority_level, fill_color)}
+        col_map = {col: idx + 1 for idx, col in enumerate(sorted_df.columns)}
+        voip_col_idx = col_map["voip_lines_quantity"]
+
+        # Track which cells have been filled and their priority levels
+        cell_fills = {}  # {(excel_row, excel_col_idx): (priority_level, fill_color)}
+        
+        # Process flagged errors and determine priorities
+        for (row_idx, col_name), cell_data in flagged_cells.items():
+            # Handle both old format (just error_msg) and new format (error_msg, orig_row)
+            if isinstance(cell_data, tuple):
+                error_msg, orig_row_stored = cell_data
+            else:
+                # Fallback for old format
+                error_msg = cell_data
+                orig_row_stored = None
+                if row_idx < len(sorted_df):
+                    orig_row_stored = sorted_df["OrigRowNum"].iloc[row_idx]
             
-            # Process flagged errors and determine priorities
-            for (row_idx, col_name), cell_data in flagged_cells.items():
-                # Handle both old format (just error_msg) and new format (error_msg, orig_row)
-                if isinstance(cell_data, tuple):
-                    error_msg, orig_row_stored = cell_data
-                else:
-                    # Fallback for old format
-                    error_msg = cell_data
-                    orig_row_stored = None
-                    if row_idx < len(sorted_df):
-                        orig_row_stored = sorted_df["OrigRowNum"].iloc[row_idx]
+            # Only process if this row still exists in filtered DataFrame
+            if orig_row_stored and orig_row_stored in orig_row_to_excel_row:
+                excel_row = orig_row_to_excel_row[orig_row_stored]
                 
-                # Only process if this row still exists in filtered DataFrame
-                if orig_row_stored and orig_row_stored in orig_row_to_excel_row:
-                    excel_row = orig_row_to_excel_row[orig_row_stored]
+                if col_name in col_map:
+                    cell_key = (excel_row, col_map[col_name])
+                    
+                    # Get priority and fill color using centralized function
+                    priority_level, fill_color = get_error_priority_and_fill(error_msg, col_name)
                     
+                    # Apply fill only if this is higher priority (lower number) than existing
+                    if cell_key not in cell_fills or priority_level < cell_fills[cell_key][0]:
+                        cell_fills[cell_key] = (priority_level, fill_color)
+                        debug_print(f"Set priority {priority_level} fill for error: '{error_msg}' at OrigRowNum {orig_row_stored}, Excel row {excel_row}, col {col_name}")
+                    else:
+                        debug_print(f"Skipped lower priority fill for error: '{error_msg}' at OrigRowNum {orig_row_stored}, Excel row {excel_row}, col {col_name}")
+                else:
+                    debug_print(f"Column {col_name} not found in col_map for orig_row {orig_row_stored}")
+            else:
+                debug_print(f"Skipping fill for orig_row={orig_row_stored}, error_msg={error_msg}: Row was excluded from Excel output")
+
+        # Final fill per cell: the winning error fill, else GREEN for a valid correction
+        fills = {}  # {(excel_row, excel_col_idx): fill_color}
+        for (excel_row, excel_col_idx), (priority_level, fill_color) in cell_fills.items():
+            fills[(excel_row, excel_col_idx)] = fill_color
+            priority_name = {1: "RED", 2: "PINK", 3: "YELLOW"}[priority_level]
+            debug_print(f"Applied {priority_name} fill at Excel row {excel_row}, col {excel_col_idx}")
+
+        # Apply correction fills using OrigRowNum for robust lookup
+        for (row_idx, col_name), info in corrected_cells.items():
+            if info["status"] == "Valid":
+                # Use the OrigRowNum stored in the correction info for accurate mapping
+                orig_row = info.get("row")
+                
+                # Only process if this OrigRowNum still exists in the filtered DataFrame
+                if orig_row and orig_row in orig_row_to_excel_row:
+                    excel_row = orig_row_to_excel_row[orig_row]
                     if col_name in col_map:
-                        excel_col = openpyxl.utils.get_column_letter(col_map[col_name])
-                        cell_key = (excel_row, excel_col)
-                        
-                        # Get priority and fill color using centralized function
-                        priority_level, fill_color = get_error_priority_and_fill(error_msg, col_name)
-                        
-                        # Apply fill only if this is higher priority (lower number) than existing
-                        if cell_key not in cell_fills or priority_level < cell_fills[cell_key][0]:
-                            cell_fills[cell_key] = (priority_level, fill_color)
-                            debug_print(f"Set priority {priority_level} fill for error: '{error_msg}' at OrigRowNum {orig_row_stored}, Excel row {excel_row}, col {excel_col}")
+                        cell_key = (excel_row, col_map[col_name])
+                        # Only apply GREEN fill if no error fill has been applied
+                        if cell_key not in cell_fills:
+                            fills[cell_key] = GREEN_FILL
+                            debug_print(f"Applied GREEN correction fill at Excel row {excel_row}, col {col_name}")
                         else:
-                            debug_print(f"Skipped lower priority fill for error: '{error_msg}' at OrigRowNum {orig_row_stored}, Excel row {excel_row}, col {excel_col}")
+                            debug_print(f"Skipped GREEN fill (error fill takes precedence) at Excel row {excel_row}, col {col_name}")
                     else:
-                        debug_print(f"Column {col_name} not found in col_map for orig_row {orig_row_stored}")
+                        debug_print(f"Failed to apply correction fill for orig_row={orig_row}: Could not map to Excel row")
                 else:
-                    debug_print(f"Skipping fill for orig_row={orig_row_stored}, error_msg={error_msg}: Row was excluded from Excel output")
-
-            # Apply all determined fills
-            for (excel_row, excel_col), (priority_level, fill_color) in cell_fills.items():
-                ws[f"{excel_col}{excel_row}"].fill = fill_color
-                priority_name = {1: "RED", 2: "PINK", 3: "YELLOW"}[priority_level]
-                debug_print(f"Applied {priority_name} fill at Excel row {excel_row}, col {excel_col}")
-
-            # Apply correction fills using OrigRowNum for robust lookup
-            for (row_idx, col_name), info in corrected_cells.items():
-                if info["status"] == "Valid":
-                    # Use the OrigRowNum stored in the correction info for accurate mapping
-                    orig_row = info.get("row")
-                    
-                    # Only process if this OrigRowNum still exists in the filtered DataFrame
-                    if orig_row and orig_row in orig_row_to_excel_row:
-                        excel_row = orig_row_to_excel_row[orig_row]
-                        if col_name in col_map:
-                            excel_col = openpyxl.utils.get_column_letter(col_map[col_name])
-                            cell_key = (excel_row, excel_col)
-                            # Only apply GREEN fill if no error fill has been applied
-                            if cell_key not in cell_fills:
-                                ws[f"{excel_col}{excel_row}"].fill = GREEN_FILL
-                                debug_print(f"Applied GREEN correction fill at Excel row {excel_row}, col {excel_col}")
-                            else:
-                                debug_print(f"Skipped GREEN fill (error fill takes precedence) at Excel row {excel_row}, col {excel_col}")
-                        else:
-                            debug_print(f"Failed to apply correction fill for orig_row={orig_row}: Could not map to Excel row")
+                    debug_print(f"Skipping correction fill for orig_row={orig_row}: Row was excluded from Excel output")
+
+        # Missing values are written as empty strings in a single pass by pandas
+        excel_df = sorted_df.fillna("")
+        try:
+            import xlsxwriter
+            excel_engine = "xlsxwriter"
+        except ImportError:
+            # xlsxwriter not installed, use openpyxl
+            excel_engine = "openpyxl"
+
+        if excel_engine == "xlsxwriter":
+            # constant_memory flushes each row to disk once the next row starts, so cells cannot be
+            # restyled after the fact: rows are written here with their fills instead of via to_excel.
+            # Options keep text as text (no auto hyperlinks) and write any inf value as an error cell
+            wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False, "nan_inf_to_errors": True})
+            try:
+                ws = wb.add_worksheet("Corrected Data")
+                # Same header style pandas' to_excel applies; other cells get no format of their own
+                # so the voip column format below still applies to them
+                header_format = wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+                ws.set_column(voip_col_idx - 1, voip_col_idx - 1, None, wb.add_format({"num_format": "0"}))
+
+                cell_formats = {}
+                row_formats = {}  # {excel_row: {excel_col_idx: format}}
+                for (excel_row, excel_col_idx), fill_color in fills.items():
+                    format_key = (fill_color.start_color.rgb[-6:], excel_col_idx == voip_col_idx)
+                    if format_key not in cell_formats:
+                        properties = {"pattern": 1, "bg_color": f"#{format_key[0]}"}
+                        if format_key[1]:
+                            properties["num_format"] = "0"
+                        cell_formats[format_key] = wb.add_format(properties)
+                    row_formats.setdefault(excel_row, {})[excel_col_idx] = cell_formats[format_key]
+
+                ws.write_row(0, 0, [str(col) for col in excel_df.columns], header_format)
+                columns = [excel_cell_values(excel_df[col]) for col in excel_df.columns]
+                for excel_row, values in enumerate(zip(*columns), start=2):
+                    formats = row_formats.get(excel_row)
+                    if formats is None:
+                        ws.write_row(excel_row - 1, 0, values)
                     else:
-                        debug_print(f"Skipping correction fill for orig_row={orig_row}: Row was excluded from Excel output")
+                        for col_pos, value in enumerate(values):
+                            ws.write(excel_row - 1, col_pos, value, formats.get(col_pos + 1))
+            finally:
+                wb.close()
+        else:
+            with pd.ExcelWriter(path, engine="openpyxl") as writer:
+                excel_df.to_excel(writer, sheet_name="Corrected Data", index=False)
+                ws = writer.book["Corrected Data"]
+                for excel_row in range(2, len(sorted_df) + 2):
+                    ws.cell(row=excel_row, column=voip_col_idx).number_format = "0"
+                for (excel_row, excel_col_idx), fill_color in fills.items():
+                    ws.cell(row=excel_row, column=excel_col_idx).fill = fill_color
 
         if os.path.isfile(path):
             debug_print(f"Successfully saved: {path}")
@@ -636,8 +935,15 @@ def save_excel(df, path, errors, corrected_cells, flagged_cells, rows_to_exclude
 def validate_subscriber_file(input_csv, company_id, period):
     """Validate subscriber CSV and generate output files."""
     from src.utils.reporting import generate_validation_report
+    from src.validation.customer import validate_customer_uniqueness, remove_full_row_duplicates
+    from src.validation.address import _classify_address, error_keys, validate_address, validate_address_column
+    from src.validation.general import validate_general_columns, validate_and_correct_state
+    from src.validation.coordinates import validate_coordinates
+    from src.validation.smarty_validation import process_smarty_corrections
     import time
     import shutil
+    # Address results are memoized per file, not across a batch run
+    _classify_address.cache_clear()
     errors = []
     corrected_cells = {}
     flagged_cells = {}
@@ -652,9 +958,18 @@ def validate_subscriber_file(input_csv, company_id, period):
     output_dir = os.path.join(base_validation_dir, period, company_id)
 
     # Delete existing directory if it exists (replacing old validation for same period)
+    # The old tree is renamed aside and unlinked on a background thread, so the run does not wait
+    # on it; the thread is not a daemon, so the delete still finishes before the process exits
     if os.path.exists(output_dir):
         debug_print(f"Removing existing validation directory: {output_dir}")
-        shutil.rmtree(output_dir)
+        stale_dir = f"{output_dir}.old.{os.getpid()}"
+        try:
+            os.replace(output_dir, stale_dir)
+        except OSError as e:
+            debug_print(f"Could not move {output_dir} aside, deleting in place: {str(e)}")
+            shutil.rmtree(output_dir)
+        else:
+            threading.Thread(target=shutil.rmtree, args=(stale_dir,), kwargs={"ignore_errors": True}).start()
 
     # Create fresh directory structure
     os.makedirs(output_dir, exist_ok=True)
@@ -683,7 +998,7 @@ def validate_subscriber_file(input_csv, company_id, period):
     base_filename = os.path.splitext(original_filename)[0]
     output_original_csv = os.path.join(company_id, original_filename)
     try:
-        shutil.copyfile(input_csv, output_original_csv)
+        copy_input_file(input_csv, output_original_csv)
         debug_print(f"Copied input CSV to {output_original_csv}")
     except Exception as e:
         errors.append({
@@ -780,11 +1095,11 @@ def validate_subscriber_file(input_csv, company_id, period):
 
     # Read input CSV starting from the correct header row (or cleaned CSV if created)
     try:
-        df = pd.read_csv(csv_to_process, dtype={col: str for col in EXPECTED_COLUMNS}, encoding='utf-8', keep_default_na=False, sep=',', skiprows=skiprows)
+        df = read_subscriber_csv(csv_to_process, 'utf-8', skiprows)
         debug_print(f"Read CSV successfully: {len(df)} rows (skipped {header_row_idx if skiprows else 0} header rows)")
     except UnicodeDecodeError:
         try:
-            df = pd.read_csv(csv_to_process, dtype={col: str for col in EXPECTED_COLUMNS}, encoding='latin1', keep_default_na=False, sep=',', skiprows=skiprows)
+            df = read_subscriber_csv(csv_to_process, 'latin1', skiprows)
             debug_print(f"Read CSV with latin1 encoding: {len(df)} rows (skipped {header_row_idx if skiprows else 0} header rows)")
         except Exception as e:
             errors.append({
@@ -839,75 +1154,38 @@ def validate_subscriber_file(input_csv, company_id, period):
     output_columns = ["OrigRowNum"] + EXPECTED_COLUMNS
     cleaned_df = df[list(column_mapping.keys())].rename(columns=column_mapping)[output_columns]
 
-    # Early data cleaning: Remove commas from customer column
-    if 'customer' in cleaned_df.columns:
-        original_customer_values = cleaned_df['customer'].copy()
-        cleaned_df['customer'] = cleaned_df['customer'].astype(str).str.replace(',', '', regex=False)
-    
-        # Track corrections for customers where commas were removed
-        for idx, (original, cleaned) in enumerate(zip(original_customer_values, cleaned_df['customer'])):
-            if pd.notna(original) and str(original) != str(cleaned) and ',' in str(original):
-                corrected_cells[(idx, "customer")] = {
-                    "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
-                    "original": str(original),
-                    "corrected": str(cleaned),
-                    "type": "Comma Removal",
-                    "status": "Valid"
-                }
-                debug_print(f"Removed comma from customer ID for OrigRowNum={cleaned_df['OrigRowNum'].iloc[idx]}: '{original}' -> '{cleaned}'")
-
-    # Early data cleaning: Remove commas from address column
-    if 'address' in cleaned_df.columns:
-        original_address_values = cleaned_df['address'].copy()
-        cleaned_df['address'] = cleaned_df['address'].astype(str).str.replace(',', '', regex=False)
-    
-        # Track corrections for addresses where commas were removed
-        for idx, (original, cleaned) in enumerate(zip(original_address_values, cleaned_df['address'])):
-            if pd.notna(original) and str(original) != str(cleaned) and ',' in str(original):
-                corrected_cells[(idx, "address")] = {
-                    "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
-                    "original": str(original),
-                    "corrected": str(cleaned),
-                    "type": "Early Comma Removal",
-                    "status": "Valid"
-                }
-                debug_print(f"Removed comma from address for OrigRowNum={cleaned_df['OrigRowNum'].iloc[idx]}: '{original}' -> '{cleaned}'")
+    orig_rows = cleaned_df["OrigRowNum"].to_numpy()
 
-    # *** NEW SECTION: Early data cleaning: Remove commas from numeric columns ***
-    numeric_columns = ['download', 'upload', 'voip_lines_quantity', 'zip']
-    for col in numeric_columns:
+    # Early data cleaning: Remove commas from customer, address and numeric columns
+    # (label is how the column is named in the debug log)
+    comma_columns = [
+        ('customer', "Comma Removal", "customer ID"),
+        ('address', "Early Comma Removal", "address"),
+    ] + [(col, f"{col.capitalize()} Comma Removal", col) for col in ['download', 'upload', 'voip_lines_quantity', 'zip']]
+    for col, correction_type, label in comma_columns:
         if col in cleaned_df.columns:
-            original_values = cleaned_df[col].copy()
-            cleaned_df[col] = cleaned_df[col].astype(str).str.replace(',', '', regex=False)
-        
-            # Track corrections for values where commas were removed
-            for idx, (original, cleaned) in enumerate(zip(original_values, cleaned_df[col])):
-                if pd.notna(original) and str(original) != str(cleaned) and ',' in str(original):
-                    corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
-                        "original": str(original),
-                        "corrected": str(cleaned),
-                        "type": f"{col.capitalize()} Comma Removal",
-                        "status": "Valid"
-                    }
-                    debug_print(f"Removed comma from {col} for OrigRowNum={cleaned_df['OrigRowNum'].iloc[idx]}: '{original}' -> '{cleaned}'")
+            remove_commas(cleaned_df, col, correction_type, label, orig_rows, corrected_cells)
 
     # Early data cleaning: Convert technology column to lowercase
     if 'technology' in cleaned_df.columns:
-        original_technology_values = cleaned_df['technology'].copy()
-        cleaned_df['technology'] = cleaned_df['technology'].astype(str).str.lower().str.strip()
+        original_technology_values = cleaned_df['technology'].astype(str)
+        cleaned_technology_values = original_technology_values.str.lower().str.strip()
+        changed = (cleaned_df['technology'].notna() & original_technology_values.ne(cleaned_technology_values)).to_numpy()
+        # Already-normalized text columns (the common case) are left as they are
+        if changed.any() or not is_plain_text(cleaned_df['technology']):
+            cleaned_df['technology'] = cleaned_technology_values
     
         # Track corrections for technology values that were changed
-        for idx, (original, cleaned) in enumerate(zip(original_technology_values, cleaned_df['technology'])):
-            if pd.notna(original) and str(original) != str(cleaned):
-                corrected_cells[(idx, "technology")] = {
-                    "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
-                    "original": str(original),
-                    "corrected": str(cleaned),
-                    "type": "Early Technology Case Normalization",
-                    "status": "Valid"
-                }
-                debug_print(f"Converted technology to lowercase for OrigRowNum={cleaned_df['OrigRowNum'].iloc[idx]}: '{original}' -> '{cleaned}'")
+        for idx in np.flatnonzero(changed):
+            original, cleaned = original_technology_values.iat[idx], cleaned_technology_values.iat[idx]
+            corrected_cells[(int(idx), "technology")] = {
+                "row": int(orig_rows[idx]),
+                "original": original,
+                "corrected": cleaned,
+                "type": "Early Technology Case Normalization",
+                "status": "Valid"
+            }
+            debug_print(f"Converted technology to lowercase for OrigRowNum={orig_rows[idx]}: '{original}' -> '{cleaned}'")
 
     # Apply data type conversions
     for col, dtype in DTYPE_DICT.items():
@@ -924,42 +1202,56 @@ def validate_subscriber_file(input_csv, company_id, period):
     cleaned_df = remove_full_row_duplicates(cleaned_df, errors, rows_to_remove, duplicate_removals, corrected_cells, flagged_cells)
 
     # Phase 1: Non-standard address endings and state correction
-    for idx, val in enumerate(cleaned_df["address"].fillna("").astype(str).str.strip()):
-        orig_row = cleaned_df["OrigRowNum"][idx]
-
-        # Check if ALL address fields are empty (GPS-only row)
-        address_empty = not val or val.strip() == ""
-        city_empty = pd.isna(cleaned_df["city"].iloc[idx]) or str(cleaned_df["city"].iloc[idx]).strip() == ""
-        state_empty = pd.isna(cleaned_df["state"].iloc[idx]) or str(cleaned_df["state"].iloc[idx]).strip() == ""
-        zip_empty = pd.isna(cleaned_df["zip"].iloc[idx]) or str(cleaned_df["zip"].iloc[idx]).strip() == ""
+    # GPS-only rows (ALL address fields empty) are found column-wise; only the rest go through validate_address
+    addresses = cleaned_df["address"].fillna("").astype(str).str.strip()
+    gps_only = (addresses.eq("") & is_blank(cleaned_df["city"]) & is_blank(cleaned_df["state"]) &
+                is_blank(cleaned_df["zip"])).to_numpy()
+    orig_rows = cleaned_df["OrigRowNum"].to_numpy()
+    states = cleaned_df["state"].tolist()
+    # Corrections are collected and written back in one assignment per column after each loop
+    address_updates = {}
+    # Duplicate-error keys for validate_address; nothing else touches errors during this loop
+    seen_errors = error_keys(errors)
+    for idx, val in enumerate(addresses.tolist()):
+        orig_row = orig_rows[idx]
 
         # If ALL address fields are empty, skip address validation (GPS-only row)
-        if address_empty and city_empty and state_empty and zip_empty:
+        if gps_only[idx]:
             debug_print(f"Phase 1: Skipping address validation for OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
             continue
 
-        state = cleaned_df["state"][idx]  # NEW: Get state from the row
-        validate_address(val, orig_row, idx, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove, non_standard_only=True, state=state)
+        state = states[idx]  # NEW: Get state from the row
+        validate_address(val, orig_row, idx, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove, non_standard_only=True, state=state, seen_errors=seen_errors)
         if (idx, "address") in corrected_cells and corrected_cells[(idx, "address")]["status"] == "Valid":
-            cleaned_df.loc[idx, "address"] = corrected_cells[(idx, "address")]["corrected"]
+            address_updates[idx] = corrected_cells[(idx, "address")]["corrected"]
+    if address_updates:
+        cleaned_df.loc[list(address_updates), "address"] = list(address_updates.values())
 
     # State validation
-    for idx, (state_val, zip_val) in enumerate(zip(cleaned_df["state"].fillna(""), cleaned_df["zip"].fillna(""))):
-        orig_row = cleaned_df["OrigRowNum"][idx]
+    # The state column keeps its string dtype (see DTYPE_DICT); instead, rows whose state is already
+    # a valid uppercase abbreviation are screened out column-wise, since validate_and_correct_state
+    # neither flags nor corrects them. GPS-only rows are found with the same column-wise test as Phase 1
+    state_values = cleaned_df["state"].fillna("")
+    state_ok = state_values.str.strip().isin(VALID_STATES).to_numpy()
+    gps_only = (is_blank(cleaned_df["address"]) & is_blank(cleaned_df["city"]) &
+                is_blank(cleaned_df["state"]) & is_blank(cleaned_df["zip"])).to_numpy()
+    states = state_values.tolist()
+    zips = cleaned_df["zip"].fillna("").tolist()
+    state_updates = {}
+    for idx in np.flatnonzero(gps_only | ~state_ok):
+        idx = int(idx)
+        orig_row = orig_rows[idx]
 
         # Check if ALL address fields are empty (GPS-only row) - skip state validation
-        address_empty = pd.isna(cleaned_df["address"].iloc[idx]) or str(cleaned_df["address"].iloc[idx]).strip() == ""
-        city_empty = pd.isna(cleaned_df["city"].iloc[idx]) or str(cleaned_df["city"].iloc[idx]).strip() == ""
-        state_empty = pd.isna(cleaned_df["state"].iloc[idx]) or str(cleaned_df["state"].iloc[idx]).strip() == ""
-        zip_empty = pd.isna(cleaned_df["zip"].iloc[idx]) or str(cleaned_df["zip"].iloc[idx]).strip() == ""
-
-        if address_empty and city_empty and state_empty and zip_empty:
+        if gps_only[idx]:
             debug_print(f"Skipping state validation for OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
             continue
 
-        corrected_state = validate_and_correct_state(state_val, zip_val, idx, orig_row, errors, corrected_cells, flagged_cells)
+        corrected_state = validate_and_correct_state(states[idx], zips[idx], idx, orig_row, errors, corrected_cells, flagged_cells)
         if (idx, "state") in corrected_cells and corrected_cells[(idx, "state")]["status"] == "Valid":
-            cleaned_df.loc[idx, "state"] = corrected_cells[(idx, "state")]["corrected"]
+            state_updates[idx] = corrected_cells[(idx, "state")]["corrected"]
+    if state_updates:
+        cleaned_df.loc[list(state_updates), "state"] = list(state_updates.values())
 
     # Ensure cleaned_df is in the correct state for Phase 2
     cleaned_df["OrigRowNum"] = cleaned_df["OrigRowNum"].astype(int)
@@ -978,50 +1270,50 @@ def validate_subscriber_file(input_csv, company_id, period):
     # NOTE: Only handles duplicate customer IDs, not data-based duplicates
     # Different customers with same data are KEPT (common in MDUs - same building, different apartments)
     validate_customer_uniqueness(cleaned_df, errors, rows_to_remove, non_unique_row_removals, corrected_cells, flagged_cells)
-    save_csv(pd.DataFrame(non_unique_row_removals), os.path.join(company_id, f"{base_filename}_N_Unq_Row_Remvl.csv"), errors)
+    save_csv(non_unique_row_removals, os.path.join(company_id, f"{base_filename}_N_Unq_Row_Remvl.csv"), errors)
 
     # Save duplicate removals report (exact duplicates and customer-based duplicates)
-    save_csv(pd.DataFrame(duplicate_removals), os.path.join(company_id, f"{base_filename}_Duplicate_Row_Removal.csv"), errors)
+    save_csv(duplicate_removals, os.path.join(company_id, f"{base_filename}_Duplicate_Row_Removal.csv"), errors)
     debug_print(f"Saved duplicate removals report: {len(duplicate_removals)} rows removed")
 
     # Deduplicate errors before further processing
-    unique_errors = {f"{e['Row']}_{e['Column']}_{e['Error']}_{e['Value']}": e for e in errors}
-    errors = list(unique_errors.values())
+    errors = dedup_errors(errors)
 
     # Convert address patterns
-    for idx, address in enumerate(cleaned_df["address"].fillna("").astype(str)):
-        orig_row = cleaned_df["OrigRowNum"][idx]
-        corrected_address = re.sub(r"(?i)\bFarm\s+to\s+Market\b", "FM", address)
-        corrected_address = re.sub(r"(?i)\bCounty\s+(?:Road|Rd)\b", "CR", corrected_address)
-        corrected_address = re.sub(r"(?i)\bPrivate\s+Road\b", "PVT RD", corrected_address)
-        if corrected_address != address:
-            cleaned_df.loc[idx, "address"] = corrected_address
-            corrected_cells[(idx, "address")] = {
-                "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
-                "original": address,
-                "corrected": corrected_address,
-                "type": "Address Pattern Conversion",
-                "status": "Valid"
-            }
+    # The rewrites run column-wise, and only on addresses containing one of the pattern words (one
+    # regex scan instead of three substitutions over every row); only rows that actually changed
+    # are written back and recorded
+    addresses = cleaned_df["address"].fillna("").astype(str)
+    candidate_positions = np.flatnonzero(addresses.str.contains(ADDRESS_PATTERN_CANDIDATE_RE).to_numpy())
+    if len(candidate_positions):
+        candidates = addresses.iloc[candidate_positions]
+        converted_addresses = (candidates.str.replace(FARM_TO_MARKET_RE, "FM", regex=True)
+                               .str.replace(COUNTY_ROAD_RE, "CR", regex=True)
+                               .str.replace(PRIVATE_ROAD_RE, "PVT RD", regex=True))
+        changed = converted_addresses.ne(candidates).to_numpy()
+        if changed.any():
+            changed_mask = np.zeros(len(addresses), dtype=bool)
+            changed_mask[candidate_positions[changed]] = True
+            cleaned_df.loc[changed_mask, "address"] = converted_addresses[changed].to_numpy()
+            orig_rows = cleaned_df["OrigRowNum"].to_numpy()
+            for idx, original, corrected in zip(candidate_positions[changed].tolist(), candidates[changed].tolist(), converted_addresses[changed].tolist()):
+                corrected_cells[(idx, "address")] = {
+                    "row": int(orig_rows[idx]),
+                    "original": original,
+                    "corrected": corrected,
+                    "type": "Address Pattern Conversion",
+                    "status": "Valid"
+                }
 
     # NEW LOGIC: Always run Smarty if there are Smarty-eligible addresses
     # Only skip Smarty entirely if there are address field critical errors (missing address, city, or state)
     # that would prevent address validation. Other critical errors (missing download, upload, customer, etc.)
     # should not prevent us from fixing addresses that CAN be validated.
 
-    # Count address-field critical errors only (address, city, state - not zip since Smarty can fill that in)
-    address_critical_errors = [error for error in errors if
-                               error.get("Error", "").startswith("Required field:") and
-                               error.get("Column", "") in ["address", "city", "state"]]
-    address_critical_flagged = [(k, v) for k, v in flagged_cells.items() if
-                                ((isinstance(v, tuple) and v[0].startswith("Required field:")) or
-                                 (isinstance(v, str) and v.startswith("Required field:"))) and
-                                k[1] in ["address", "city", "state"]]
-
     # Check if there are ANY Smarty-eligible addresses in flagged_cells
     from src.validation.smarty_validation import should_send_to_smarty
-    smarty_eligible_count = sum(1 for (row_idx, col_name), cell_data in flagged_cells.items()
-                                if should_send_to_smarty(cell_data[0] if isinstance(cell_data, tuple) else cell_data))
+    smarty_eligible_count = sum(1 for cell_data in flagged_cells.values()
+                                if should_send_to_smarty(flag_message(cell_data)))
 
     if smarty_eligible_count == 0:
         debug_print("No addresses eligible for Smarty processing - skipping Smarty API")
@@ -1033,49 +1325,68 @@ def validate_subscriber_file(input_csv, company_id, period):
             'smarty_corrections': [],
             'processing_time': 0.0
         }
-    elif address_critical_errors or address_critical_flagged:
-        # Only log that some rows have address field issues, but still process what we can
-        debug_print(f"Found {len(address_critical_errors)} address field critical errors, but proceeding with Smarty for {smarty_eligible_count} eligible addresses")
-        debug_print("Starting Smarty API processing for eligible addresses...")
-        smarty_results = process_smarty_corrections(
-            cleaned_df, errors, corrected_cells, flagged_cells, company_id, base_filename
-        )
     else:
-        # No address field critical errors - proceed normally
-        debug_print(f"Starting Smarty API processing for {smarty_eligible_count} eligible addresses...")
+        # The address-field critical error scans only decide which message is logged, so they are
+        # skipped when nothing goes to Smarty. Count address-field critical errors only (address, city,
+        # state - not zip since Smarty can fill that in); the cheap column test runs first
+        address_critical_error_count = sum(1 for error in errors if
+                                           error.get("Column", "") in ("address", "city", "state") and
+                                           error.get("Error", "").startswith("Required field:"))
+        if address_critical_error_count or any(k[1] in ("address", "city", "state") and is_required_field_flag(v)
+                                               for k, v in flagged_cells.items()):
+            # Only log that some rows have address field issues, but still process what we can
+            debug_print("Found %s address field critical errors, but proceeding with Smarty for %s eligible addresses", address_critical_error_count, smarty_eligible_count)
+            debug_print("Starting Smarty API processing for eligible addresses...")
+        else:
+            # No address field critical errors - proceed normally
+            debug_print("Starting Smarty API processing for %s eligible addresses...", smarty_eligible_count)
         smarty_results = process_smarty_corrections(
             cleaned_df, errors, corrected_cells, flagged_cells, company_id, base_filename
         )
 
     # Collect all rows to exclude from final Excel output (immediate removals only)
-    all_rows_to_exclude = set(rows_to_remove).union(
-        int(error["Row"]) for error in pobox_errors
+    # np.union1d returns a sorted, de-duplicated int64 array ready for np.isin
+    all_rows_to_exclude = np.union1d(
+        np.asarray(rows_to_remove, dtype=np.int64),
+        np.fromiter((int(error["Row"]) for error in pobox_errors), dtype=np.int64, count=len(pobox_errors))
     )
     # Note: No Smarty-based removals added here - final decision made in reporting
 
-    debug_print(f"Rows to remove from duplicates: {rows_to_remove}")
+    debug_print("Rows to remove from duplicates: %s", rows_to_remove)
     debug_print(f"Total rows to exclude from Excel: {len(all_rows_to_exclude)} (PO Box: {len(pobox_errors)}, Invalid/Duplicates: {len(rows_to_remove)})")
     debug_print("Smarty failures will be evaluated by final validation decision logic")
 
-    # Save final outputs (rows are filtered only in save_excel)
-    save_excel(cleaned_df, os.path.join(company_id, f"{base_filename}_Corrected_Subscribers.xlsx"), errors, corrected_cells, flagged_cells, all_rows_to_exclude)
-    save_csv(pd.DataFrame(errors), os.path.join(company_id, f"{base_filename}_Errors.csv"), errors)
-    save_csv(pd.DataFrame(pobox_errors), os.path.join(company_id, f"{base_filename}_POBox_Errors.csv"), errors)
-
     # Save clean CSV for Code B geocoding (matching Excel content - excluded rows removed, OrigRowNum stripped)
     # This CSV is ready for Phase 2 processing (geocoding, tract assignment, database insertion)
-    cleaned_for_csv = cleaned_df[~cleaned_df["OrigRowNum"].isin(all_rows_to_exclude)].copy()
+    # The kept-row mask is computed once (np.isin on int64 arrays) and reused for the validation frame below
+    keep_rows = ~np.isin(cleaned_df["OrigRowNum"].to_numpy(), all_rows_to_exclude)
     # Remove OrigRowNum column - not needed for geocoding phase
-    if 'OrigRowNum' in cleaned_for_csv.columns:
-        cleaned_for_csv = cleaned_for_csv.drop(columns=['OrigRowNum'])
-    # IMPORTANT: Use empty header_comment for Code B compatibility (no python version comment)
-    save_csv(cleaned_for_csv, os.path.join(company_id, f"{base_filename}_Corrected_Subscribers.csv"), errors, header_comment="")
+    cleaned_for_csv = cleaned_df[keep_rows].drop(columns=['OrigRowNum'], errors='ignore')
+
+    # Save final outputs (rows are filtered only in save_excel)
+    # The POBox and geocoding CSVs do not depend on the other outputs, so they are written on worker
+    # threads while the Excel file is built. The Errors CSV stays on this thread after save_excel,
+    # which appends its type-conversion errors to errors. Save failures from the workers are collected
+    # separately and added to errors once they finish, so Errors.csv is not written while it changes.
+    from concurrent.futures import ThreadPoolExecutor
+    background_save_errors = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        background_saves = [
+            executor.submit(save_csv, pobox_errors, os.path.join(company_id, f"{base_filename}_POBox_Errors.csv"), background_save_errors),
+            # IMPORTANT: Use empty header_comment for Code B compatibility (no python version comment)
+            executor.submit(save_csv, cleaned_for_csv, os.path.join(company_id, f"{base_filename}_Corrected_Subscribers.csv"), background_save_errors, header_comment=""),
+        ]
+        save_excel(cleaned_df, os.path.join(company_id, f"{base_filename}_Corrected_Subscribers.xlsx"), errors, corrected_cells, flagged_cells, all_rows_to_exclude)
+        save_csv(errors, os.path.join(company_id, f"{base_filename}_Errors.csv"), errors)
+        for future in background_saves:
+            future.result()
+    errors.extend(background_save_errors)
     debug_print(f"Saved clean CSV for geocoding: {len(cleaned_for_csv)} rows (excluded {len(all_rows_to_exclude)} problematic rows)")
     
     # Generate validation report and get file validation status
     # This is where the final decision on Smarty failures is made using subscriber-count thresholds
     # IMPORTANT: Filter cleaned_df to exclude removed rows before validation assessment
-    cleaned_df_for_validation = cleaned_df[~cleaned_df["OrigRowNum"].isin(all_rows_to_exclude)].copy()
+    cleaned_df_for_validation = cleaned_df[keep_rows].copy()
     debug_print(f"Passing {len(cleaned_df_for_validation)} rows to validation assessment (excluded {len(all_rows_to_exclude)} rows)")
 
     vr_excel_path, vr_json_path, file_validation = generate_validation_report(
@@ -1084,34 +1395,41 @@ def validate_subscriber_file(input_csv, company_id, period):
     )
     
     # Log final validation status
-    debug_print(f"=== FINAL VALIDATION STATUS ===")
-    debug_print(f"File Status: {file_validation.get('file_status', 'Unknown')}")
-    debug_print(f"Validation Reason: {file_validation.get('validation_reason', 'No reason provided')}")
-    debug_print(f"Total Subscribers: {file_validation.get('total_subscribers', 0)}")
-    debug_print(f"Address Errors: {file_validation.get('address_error_count', 0)} ({file_validation.get('address_error_percentage', 0):.2f}%)")
-    debug_print(f"Non-Address Errors: {file_validation.get('non_address_error_count', 0)}")
-    debug_print(f"Requires Manual Review: {file_validation.get('requires_manual_review', True)}")
-    debug_print(f"Threshold Used: {file_validation.get('threshold_used', {}).get('description', 'Unknown')}")
-    debug_print(f"================================")
+    fv = file_validation
+    file_status = fv.get('file_status', 'Unknown')
+    validation_reason = fv.get('validation_reason')
+    total_subscribers = fv.get('total_subscribers', 0)
+    address_error_count = fv.get('address_error_count', 0)
+    address_error_percentage = fv.get('address_error_percentage', 0)
+    non_address_error_count = fv.get('non_address_error_count', 0)
+    debug_print("=== FINAL VALIDATION STATUS ===")
+    debug_print("File Status: %s", file_status)
+    debug_print("Validation Reason: %s", validation_reason or 'No reason provided')
+    debug_print("Total Subscribers: %s", total_subscribers)
+    debug_print("Address Errors: %s (%.2f%%)", address_error_count, address_error_percentage)
+    debug_print("Non-Address Errors: %s", non_address_error_count)
+    debug_print("Requires Manual Review: %s", fv.get('requires_manual_review', True))
+    debug_print("Threshold Used: %s", (fv.get('threshold_used') or {}).get('description', 'Unknown'))
+    debug_print("================================")
     
     # Display user-friendly status message
-    if file_validation.get('file_status') == 'Valid':
+    if file_status == 'Valid':
         print(f"\n✅ SUCCESS: File validation completed successfully!")
-        print(f"📄 Status: {file_validation['file_status']}")
-        print(f"📊 Final subscriber count: {file_validation.get('total_subscribers', 0)}")
-        if file_validation.get('address_error_count', 0) > 0:
-            print(f"🔧 Automatically removed {file_validation['address_error_count']} rows with address issues")
+        print(f"📄 Status: {file_status}")
+        print(f"📊 Final subscriber count: {total_subscribers}")
+        if address_error_count > 0:
+            print(f"🔧 Automatically removed {address_error_count} rows with address issues")
         print(f"🎯 File is ready for FCC BDC submission")
         print(f"📂 Output: {company_id}/{base_filename}_Corrected_Subscribers.xlsx")
     else:
         print(f"\n❌ ATTENTION: File requires manual review")
-        print(f"📄 Status: {file_validation['file_status']}")
-        print(f"⚠️  Reason: {file_validation.get('validation_reason', 'Unknown issue')}")
-        print(f"📊 Total subscribers: {file_validation.get('total_subscribers', 0)}")
-        if file_validation.get('non_address_error_count', 0) > 0:
-            print(f"🚨 Critical errors in required fields: {file_validation['non_address_error_count']} rows")
-        if file_validation.get('address_error_count', 0) > 0:
-            print(f"📍 Address issues requiring review: {file_validation['address_error_count']} rows ({file_validation.get('address_error_percentage', 0):.2f}%)")
+        print(f"📄 Status: {file_status}")
+        print(f"⚠️  Reason: {validation_reason or 'Unknown issue'}")
+        print(f"📊 Total subscribers: {total_subscribers}")
+        if non_address_error_count > 0:
+            print(f"🚨 Critical errors in required fields: {non_address_error_count} rows")
+        if address_error_count > 0:
+            print(f"📍 Address issues requiring review: {address_error_count} rows ({address_error_percentage:.2f}%)")
         print(f"👤 Manual intervention required before FCC BDC submission")
         print(f"📂 Review file: {company_id}/{base_filename}_Corrected_Subscribers.xlsx")
         print(f"📋 Detailed report: {company_id}/{base_filename}_VR.xlsx")
@@ -1121,6 +1439,18 @@ def validate_subscriber_file(input_csv, company_id, period):
 
     return cleaned_df, errors, file_validation
 
+def dedup_errors(errors):
+    """
+    Return errors with repeated entries removed, in first-seen order.
+
+    Entries are keyed by a (Row, Column, Error, Value) tuple rather than a formatted string; Value
+    is compared as text since the same cell can be reported with a str or a numeric/NaN value.
+    For repeated keys the last entry is kept.
+    """
+    unique_errors = {(e.get('Row'), e.get('Column'), e.get('Error'), str(e.get('Value'))): e for e in errors}
+    return list(unique_errors.values())
+
+
 def save_errors_and_exit(errors, company_id, base_filename, exit_code=1):
     """Save errors and exit the program with specified exit code.
 
@@ -1131,6 +1461,6 @@ def save_errors_and_exit(errors, company_id, base_filename, exit_code=1):
     """
     import sys
     path = os.path.join(company_id, f"{base_filename}_Errors.csv")
-    save_csv(pd.DataFrame(errors), path, errors)
+    save_csv(dedup_errors(errors), path, errors)
     debug_print(f"Errors saved to {path}. Exiting with code {exit_code}.")
     sys.exit(exit_code)
\ No newline at end of file
@@ -4,19 +4,32 @@ from src.config.settings import DEBUG_MODE
 
 
 def setup_logging():
-    """Configure logging for the application."""
+    """
+    Configure logging for the application.
+
+    Safe to call more than once: handlers are only attached if the root logger has none. The
+    log file is opened on the first record (delay=True) and rotated at 10 MB.
+    """
     import logging
+    from logging.handlers import RotatingFileHandler
+    if logging.getLogger().handlers:
+        return
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.FileHandler("app.log"),
+            RotatingFileHandler("app.log", maxBytes=10 * 1024 * 1024, backupCount=3, delay=True),
             logging.StreamHandler()
         ]
     )
 
 
-def debug_print(message):
-    """Print debug messages if DEBUG_MODE is enabled."""
+def debug_print(message, *args):
+    """
+    Print debug messages if DEBUG_MODE is enabled.
+
+    Like logging, extra args are %-formatted into message only when the message is printed,
+    so debug_print("Row %s: %s", orig_row, value) costs nothing when DEBUG_MODE is off.
+    """
     if DEBUG_MODE:
-        print(f"DEBUG: {message}")
\ No newline at end of file
+        print(f"DEBUG: {message % args if args else message}")
\ No newline at end of file
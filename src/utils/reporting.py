@@ -3,34 +3,78 @@
 import pandas as pd
 import numpy as np
 import json
+import functools
 import time
 import traceback
 import os
 from datetime import datetime
+from dataclasses import asdict
 from src.utils.logging import debug_print
-from src.utils.file_handling import save_csv
-from src.config.settings import get_validation_threshold, is_address_column, ADDRESS_COLUMNS
+from src.utils.file_handling import save_csv, dedup_errors, excel_cell_values
+from src.config.settings import get_validation_threshold, address_columns_in, ARROW_STRING_DTYPE
+
+# Optional orjson for faster JSON report serialization
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, use the standard library json module
+    orjson = None
+
+# Smarty Processing Log tab columns, in the key order of the smarty_corrections_data records
+SMARTY_PROCESSING_LOG_COLUMNS = [
+    "OrigRowNum",
+    "Reason Sent",
+    "Original Address",
+    "Corrected Address",
+    "Original City",
+    "Corrected City",
+    "Original State",
+    "Corrected State",
+    "Original ZIP",
+    "Corrected ZIP",
+    "Status",
+    "Error Message",
+    "Smarty Key",
+    "Timestamp"
+]
+
+# Address errors whose rows are reported as invalid address removals
+INVALID_ADDRESS_REMOVAL_ERRORS = frozenset({
+    "Address too short",
+    "Unsupported character detected",
+    "Non-address content detected",
+    "Address lacks leading number followed by street name"
+})
 
 
 def convert_numpy_types(obj):
     """Convert NumPy types to Python native types."""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
+    if isinstance(obj, str):
+        return obj
     elif isinstance(obj, dict):
         return {key: convert_numpy_types(value) for key, value in obj.items()}
     elif isinstance(obj, list):
         return [convert_numpy_types(item) for item in obj]
-    elif pd.isna(obj):
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        # NaN becomes None so every JSON engine writes null (a bare NaN is not valid JSON)
+        value = float(obj)
+        return None if value != value else value
+    elif isinstance(obj, np.ndarray):
+        return convert_numpy_types(obj.tolist())
+    # Missing-value check without going through pd.isna dispatch (NaN != NaN)
+    elif obj is None or obj is pd.NA or obj is pd.NaT or (isinstance(obj, float) and obj != obj):
         return None
     return obj
 
 
+@functools.lru_cache(maxsize=1)
 def load_error_dictionary():
-    """Load error dictionary from CSV file if it exists."""
+    """Load error dictionary from CSV file if it exists.
+
+    The result is cached for the life of the process; callers must not modify the returned DataFrame.
+    """
     try:
         # Try multiple possible paths for the CSV file
         possible_paths = [
@@ -86,11 +130,9 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
     col_name_to_excel_col = {col: idx + 1 for idx, col in enumerate(df_columns)}
     
     # Create mapping from OrigRowNum to Excel row number
-    orig_row_to_excel_row = {}
-    for idx, row in cleaned_df.iterrows():
-        excel_row = idx + 2  # Excel rows start at 2 (after header)
-        orig_row = row["OrigRowNum"]
-        orig_row_to_excel_row[orig_row] = excel_row
+    # Excel rows start at 2 (after header)
+    orig_row_to_excel_row = dict(zip(cleaned_df["OrigRowNum"].tolist(), (cleaned_df.index + 2).tolist()))
+    excel_row_to_orig = {ex_row: orig for orig, ex_row in orig_row_to_excel_row.items()}
     
     # Count total subscribers in final file
     total_subscribers = len(cleaned_df)
@@ -99,6 +141,10 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
     address_error_rows = set()
     non_address_error_rows = set()
     critical_errors_detail = []  # NEW: Detailed list for Critical Errors tab
+    address_columns = address_columns_in(df_columns)
+
+    import openpyxl.utils
+    col_letter_to_idx = {}
 
     # Analyze cell fills for RED and PINK priorities
     for (excel_row, excel_col_letter), (priority_level, fill_color) in cell_fills.items():
@@ -107,23 +153,21 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
             continue
 
         # Convert Excel column letter to column index
-        import openpyxl.utils
-        excel_col_idx = openpyxl.utils.column_index_from_string(excel_col_letter)
+        excel_col_idx = col_letter_to_idx.get(excel_col_letter)
+        if excel_col_idx is None:
+            excel_col_idx = openpyxl.utils.column_index_from_string(excel_col_letter)
+            col_letter_to_idx[excel_col_letter] = excel_col_idx
 
         # Find the DataFrame column name
         if excel_col_idx <= len(df_columns):
             col_name = df_columns[excel_col_idx - 1]
 
             # Find the original row number for this Excel row
-            orig_row = None
-            for orig, ex_row in orig_row_to_excel_row.items():
-                if ex_row == excel_row:
-                    orig_row = orig
-                    break
+            orig_row = excel_row_to_orig.get(excel_row)
 
             if orig_row is not None:
                 # Check if row still exists in cleaned_df
-                if orig_row not in cleaned_df["OrigRowNum"].values:
+                if orig_row not in orig_row_to_excel_row:
                     continue  # Skip rows that were already removed
 
                 # Get the actual cell value and error message from flagged_cells
@@ -134,19 +178,19 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
                 for (row_idx, flagged_col_name), cell_data in flagged_cells.items():
                     if flagged_col_name == col_name:
                         # Check if this flagged cell corresponds to our orig_row
-                        if row_idx < len(cleaned_df) and cleaned_df.iloc[row_idx]["OrigRowNum"] == orig_row:
+                        if row_idx < len(cleaned_df) and cleaned_df["OrigRowNum"].iat[row_idx] == orig_row:
                             if isinstance(cell_data, tuple):
                                 error_msg, _ = cell_data
                             else:
                                 error_msg = cell_data
                             # Get the actual cell value
-                            cell_value = str(cleaned_df.iloc[row_idx].get(col_name, ""))
+                            cell_value = str(cleaned_df[col_name].iat[row_idx]) if col_name in cleaned_df.columns else ""
                             break
 
                 # Categorize the error
                 # IMPORTANT: We count ALL errors, even in excluded rows
                 # Non-address errors should fail validation regardless of whether row was excluded
-                if is_address_column(col_name):
+                if col_name in address_columns:
                     address_error_rows.add(orig_row)
                 else:
                     non_address_error_rows.add(orig_row)
@@ -175,7 +219,7 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
         validation_reason = f"File contains {non_address_error_count} rows with critical errors in required fields (customer, speeds, technology, etc.) that must be manually corrected."
         requires_manual_review = True
         
-    elif address_error_percentage <= threshold_config["max_error_percentage"]:
+    elif address_error_percentage <= threshold_config.max_error_percentage:
         # Address errors within threshold = valid (remove problematic rows)
         file_status = "Valid"
         if address_error_count == 0:
@@ -187,7 +231,7 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
     else:
         # Address errors exceed threshold = invalid
         file_status = "Invalid"
-        validation_reason = f"File contains {address_error_count} rows ({address_error_percentage:.2f}%) with address issues, exceeding the {threshold_config['max_error_percentage']}% threshold for {total_subscribers} subscribers. Manual address review required."
+        validation_reason = f"File contains {address_error_count} rows ({address_error_percentage:.2f}%) with address issues, exceeding the {threshold_config.max_error_percentage}% threshold for {total_subscribers} subscribers. Manual address review required."
         requires_manual_review = True
     
     return {
@@ -197,27 +241,91 @@ def assess_file_validation_status(cleaned_df, cell_fills, rows_excluded_from_exc
         'address_error_count': address_error_count,
         'non_address_error_count': non_address_error_count,
         'address_error_percentage': round(address_error_percentage, 2),
-        'threshold_used': threshold_config,
+        'threshold_used': asdict(threshold_config),
         'problematic_address_rows': list(address_error_rows),  # FIXED: Convert set to list
         'requires_manual_review': requires_manual_review,
         'critical_errors_detail': critical_errors_detail  # NEW: Detailed error info for Excel tab
     }
 
 
+def write_report_workbook(path, sheets):
+    """
+    Write the validation report tabs to an Excel file in a single streaming pass.
+
+    Args:
+        path (str): Output .xlsx path
+        sheets (list): (sheet_name, DataFrame) pairs in tab order; a list of column names in place
+            of the DataFrame writes a header-only tab without building an empty frame
+
+    The workbook is opened in openpyxl's write_only mode, so rows are streamed to disk instead
+    of being held as cell objects. Cells get the values and header style pandas' to_excel would
+    write, and each column is sized from its longest value (longest + 2, max 50).
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    thin = Side(style="thin")
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal="center", vertical="top")
+
+    for sheet_name, df in sheets:
+        ws = wb.create_sheet(title=sheet_name)
+        header_only = isinstance(df, list)
+        col_names = df if header_only else list(df.columns)
+        columns = []
+        for col_pos, col in enumerate(col_names, start=1):
+            max_length = len(str(col))
+            if not header_only:
+                series = df[col]
+                values = excel_cell_values(series)
+                missing = series.isna().to_numpy()
+                if missing.any():
+                    values = ["" if is_missing else value for value, is_missing in zip(values, missing)]
+                columns.append(values)
+
+                # Text lengths come from the (Arrow-backed when available) string kernel; missing
+                # cells are written empty, so their NA lengths count as 0
+                lengths = series.astype(ARROW_STRING_DTYPE).str.len().to_numpy(dtype="int64", na_value=0)
+                if len(lengths):
+                    max_length = max(max_length, int(lengths.max()))
+
+            # Widths must be set before the first row is written in write_only mode
+            ws.column_dimensions[get_column_letter(col_pos)].width = min(max_length + 2, 50)
+
+        header = []
+        for col in col_names:
+            cell = WriteOnlyCell(ws, value=col)
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header.append(cell)
+        ws.append(header)
+        for row in zip(*columns):
+            ws.append(row)
+
+    wb.save(path)
+
+
 def generate_validation_report(cleaned_df, company_id, base_filename, errors, start_time, corrected_cells, flagged_cells, pobox_errors, non_unique_row_removals, smarty_results=None, duplicate_removals=None):
     """Generate validation report in Excel and JSON formats."""
     vr_excel_path = f"{company_id}/{base_filename}_VR.xlsx"
     vr_json_path = f"{company_id}/{base_filename}_VR.json"
 
     try:
-        # Create a copy of the DataFrame and convert all columns to native Python types
+        # Create a copy of the DataFrame with missing text values as None.
+        # Numeric columns already yield native values on access, so only the
+        # object/string columns need converting, in one bulk pass.
         cleaned_df = cleaned_df.copy()
-        for col in cleaned_df.columns:
-            if cleaned_df[col].dtype == "int64":
-                cleaned_df[col] = cleaned_df[col].astype(int)
-            elif cleaned_df[col].dtype == "float64":
-                cleaned_df[col] = cleaned_df[col].astype(float)
-            cleaned_df[col] = cleaned_df[col].apply(convert_numpy_types)
+        text_df = cleaned_df.select_dtypes(include=["object", "string"]).astype(object)
+        # infer_objects turns columns holding only numbers and missing values back into float64
+        # (missing as NaN), as the per-column apply did, so empty numeric cells still read as "nan"
+        cleaned_df[text_df.columns] = text_df.where(text_df.notna(), None).infer_objects()
+        orig_rows = cleaned_df["OrigRowNum"].tolist()
+        orig_row_set = set(orig_rows)
 
         # Convert other data structures
         pobox_errors_converted = [convert_numpy_types(error) for error in pobox_errors]
@@ -225,15 +333,15 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
 
         # Deduplicate errors to prevent repetition
         debug_print(f"Raw errors before deduplication: {len(errors)}")
-        unique_errors = {f"{e['Row']}_{e['Column']}_{e['Error']}_{e['Value']}": e for e in errors}
+        unique_errors = dedup_errors(errors)
         debug_print(f"Deduplicated {len(errors) - len(unique_errors)} errors. Unique errors: {len(unique_errors)}")
-        errors_converted = [convert_numpy_types(error) for error in unique_errors.values()]
+        errors_converted = [convert_numpy_types(error) for error in unique_errors]
         street_ending_errors = [error for error in errors_converted if error["Error"] == "Lacks standard street ending"]
         filtered_errors_converted = [error for error in errors_converted if error["Error"] != "Lacks standard street ending"]
         non_unique_row_removals_converted = [convert_numpy_types(removal) for removal in non_unique_row_removals]
         
         # Create a mapping from original row index to new index based on OrigRowNum
-        orig_row_to_new_idx = {row["OrigRowNum"]: i for i, row in cleaned_df.iterrows()}
+        orig_row_to_new_idx = dict(zip(cleaned_df["OrigRowNum"].tolist(), cleaned_df.index.tolist()))
         corrected_cells_converted_raw = {}
         for k, v in corrected_cells.items():
             orig_row = v.get("row", None)  # Get OrigRowNum from correction info
@@ -255,22 +363,16 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
         
         flagged_cells_converted = {k: convert_numpy_types(v) for k, v in flagged_cells.items()}
 
-        # Build invalid address removals
-        invalid_address_removals = [
-            {
-                "OrigRowNum": int(error["Row"]),
-                "address": error["Value"],
-                "Error": error["Error"]
-            }
-            for error in errors_converted
-            if error["Row"] != "N/A" and error["Error"] in [
-                "Address too short",
-                "Unsupported character detected",
-                "Non-address content detected",
-                "Address lacks leading number followed by street name"
-            ]
-        ]
-        unique_invalid_addresses = {f"{r['OrigRowNum']}_{r['address']}_{r['Error']}": r for r in invalid_address_removals}
+        # Build invalid address removals, deduplicated in the same pass
+        unique_invalid_addresses = {}
+        for error in errors_converted:
+            if error["Row"] != "N/A" and error["Error"] in INVALID_ADDRESS_REMOVAL_ERRORS:
+                removal = {
+                    "OrigRowNum": int(error["Row"]),
+                    "address": error["Value"],
+                    "Error": error["Error"]
+                }
+                unique_invalid_addresses[(removal["OrigRowNum"], removal["address"], removal["Error"])] = removal
         invalid_address_removals_converted = list(unique_invalid_addresses.values())
 
         # Process Smarty results
@@ -278,7 +380,7 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
         smarty_summary = {}
         
         if smarty_results:
-            debug_print(f"Processing Smarty results for reporting: {smarty_results}")
+            debug_print("Processing Smarty results for reporting: %s", smarty_results)
             
             # Convert Smarty corrections to processing log format
             smarty_corrections_data = [
@@ -324,9 +426,8 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
         debug_print("Generating Excel file to assess validation status...")
         
         # Collect all rows to exclude (same logic as in file_handling.py)
-        all_rows_to_exclude = set().union(
-            int(error["Row"]) for error in pobox_errors_converted if error["Row"] != "N/A"
-        ).union(
+        all_rows_to_exclude = {int(error["Row"]) for error in pobox_errors_converted if error["Row"] != "N/A"}
+        all_rows_to_exclude.update(
             int(removal["OrigRowNum"]) for removal in non_unique_row_removals_converted if removal["OrigRowNum"] != "N/A"
         )
         
@@ -338,68 +439,31 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
             ]
             all_rows_to_exclude.update(smarty_removal_rows)
         
-        # Check for critical non-address errors BEFORE any row exclusions
-        # This ensures we catch misaligned columns and other critical errors
-        debug_print("Checking for critical non-address errors in all flagged cells...")
-        critical_non_address_errors = set()
-        critical_errors_detail_early = []  # NEW: Collect detailed error info in early check
-
-        from src.utils.file_handling import get_error_priority_and_fill
-        from src.config.settings import is_address_column
-
-        for (row_idx, col_name), cell_data in flagged_cells_converted.items():
-            if isinstance(cell_data, tuple):
-                error_msg, orig_row_stored = cell_data
-            else:
-                error_msg = cell_data
-                orig_row_stored = None
-                if row_idx < len(cleaned_df):
-                    orig_row_stored = cleaned_df["OrigRowNum"].iloc[row_idx]
-
-            if orig_row_stored:
-                # IMPORTANT: Only check rows that are still in the final cleaned_df
-                if orig_row_stored not in cleaned_df["OrigRowNum"].values:
-                    debug_print(f"Skipping error for OrigRowNum={orig_row_stored} - row already removed from cleaned_df")
-                    continue
-
-                priority_level, fill_color = get_error_priority_and_fill(error_msg, col_name)
-
-                # Check for RED (priority 1) or PINK (priority 2) cells in non-address columns
-                if priority_level in [1, 2] and not is_address_column(col_name):
-                    critical_non_address_errors.add(orig_row_stored)
-                    debug_print(f"Critical non-address error found: OrigRowNum={orig_row_stored}, col={col_name}, error={error_msg}")
-
-                    # NEW: Collect detailed info for Critical Errors tab
-                    cell_value = ""
-                    if row_idx < len(cleaned_df):
-                        cell_value = str(cleaned_df.iloc[row_idx].get(col_name, ""))
-
-                    critical_errors_detail_early.append({
-                        "OrigRowNum": int(orig_row_stored),
-                        "Column": col_name,
-                        "Error Type": error_msg,
-                        "Current Value": cell_value,
-                        "Severity": "Critical" if priority_level == 1 else "Important"
-                    })
-
-        # If there are critical non-address errors, fail immediately
-        if critical_non_address_errors:
-            debug_print(f"File validation FAILED: {len(critical_non_address_errors)} rows with critical non-address errors")
+        if cleaned_df.empty:
+            # No rows survived cleaning: there is nothing to submit, and the flagged-cell passes
+            # are skipped since they cannot match any row
+            debug_print("File validation FAILED: no subscriber rows remain in cleaned_df")
             file_validation = {
                 'file_status': 'Invalid',
-                'validation_reason': f"File contains {len(critical_non_address_errors)} rows with critical errors in required fields (customer, state, speeds, technology, etc.) that must be manually corrected. This includes column misalignment and invalid data.",
-                'total_subscribers': len(cleaned_df),
+                'validation_reason': "File contains no subscriber rows after removals. Review the removal tabs for why every row was removed.",
+                'total_subscribers': 0,
                 'address_error_count': 0,
-                'non_address_error_count': len(critical_non_address_errors),
+                'non_address_error_count': 0,
                 'address_error_percentage': 0.0,
-                'threshold_used': {},
+                'threshold_used': {},  # No threshold applies, same shape as the critical-errors branch
                 'problematic_address_rows': [],
                 'requires_manual_review': True,
-                'critical_errors_detail': critical_errors_detail_early  # NEW: Include detailed errors
+                'critical_errors_detail': []
             }
         else:
-            # Simulate cell fills logic for address-only validation (based on save_excel function)
-            temp_cell_fills = {}
+            # Check for critical non-address errors BEFORE any row exclusions
+            # This ensures we catch misaligned columns and other critical errors
+            debug_print("Checking for critical non-address errors in all flagged cells...")
+            critical_non_address_errors = set()
+            critical_errors_detail_early = []  # NEW: Collect detailed error info in early check
+
+            from src.utils.file_handling import get_error_priority_and_fill
+            address_columns = address_columns_in({col_name for (_, col_name) in flagged_cells_converted})
 
             for (row_idx, col_name), cell_data in flagged_cells_converted.items():
                 if isinstance(cell_data, tuple):
@@ -408,18 +472,76 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
                     error_msg = cell_data
                     orig_row_stored = None
                     if row_idx < len(cleaned_df):
-                        orig_row_stored = cleaned_df["OrigRowNum"].iloc[row_idx]
-
-                if orig_row_stored and orig_row_stored not in all_rows_to_exclude:
-                    # Find Excel row position
-                    orig_row_to_excel_row = {row["OrigRowNum"]: i + 2 for i, row in cleaned_df.iterrows() if row["OrigRowNum"] not in all_rows_to_exclude}
-
-                    if orig_row_stored in orig_row_to_excel_row:
-                        excel_row = orig_row_to_excel_row[orig_row_stored]
-                        col_map = {col: idx + 1 for idx, col in enumerate(cleaned_df.columns)}
-
-                        if col_name in col_map:
-                            import openpyxl.utils
+                        orig_row_stored = orig_rows[row_idx]
+
+                if orig_row_stored:
+                    # IMPORTANT: Only check rows that are still in the final cleaned_df
+                    if orig_row_stored not in orig_row_set:
+                        debug_print(f"Skipping error for OrigRowNum={orig_row_stored} - row already removed from cleaned_df")
+                        continue
+
+                    priority_level, fill_color = get_error_priority_and_fill(error_msg, col_name)
+
+                    # Check for RED (priority 1) or PINK (priority 2) cells in non-address columns
+                    if priority_level in [1, 2] and col_name not in address_columns:
+                        critical_non_address_errors.add(orig_row_stored)
+                        debug_print(f"Critical non-address error found: OrigRowNum={orig_row_stored}, col={col_name}, error={error_msg}")
+
+                        # NEW: Collect detailed info for Critical Errors tab
+                        cell_value = ""
+                        if row_idx < len(cleaned_df):
+                            cell_value = str(cleaned_df[col_name].iat[row_idx]) if col_name in cleaned_df.columns else ""
+
+                        critical_errors_detail_early.append({
+                            "OrigRowNum": int(orig_row_stored),
+                            "Column": col_name,
+                            "Error Type": error_msg,
+                            "Current Value": cell_value,
+                            "Severity": "Critical" if priority_level == 1 else "Important"
+                        })
+
+            # If there are critical non-address errors, fail immediately
+            if critical_non_address_errors:
+                debug_print(f"File validation FAILED: {len(critical_non_address_errors)} rows with critical non-address errors")
+                file_validation = {
+                    'file_status': 'Invalid',
+                    'validation_reason': f"File contains {len(critical_non_address_errors)} rows with critical errors in required fields (customer, state, speeds, technology, etc.) that must be manually corrected. This includes column misalignment and invalid data.",
+                    'total_subscribers': len(cleaned_df),
+                    'address_error_count': 0,
+                    'non_address_error_count': len(critical_non_address_errors),
+                    'address_error_percentage': 0.0,
+                    'threshold_used': {},
+                    'problematic_address_rows': [],
+                    'requires_manual_review': True,
+                    'critical_errors_detail': critical_errors_detail_early  # NEW: Include detailed errors
+                }
+            else:
+                # Simulate cell fills logic for address-only validation (based on save_excel function)
+                temp_cell_fills = {}
+
+                # Excel row/column positions only depend on the final frame, so build them once
+                import openpyxl.utils
+                orig_row_to_excel_row = {
+                    orig: i + 2
+                    for orig, i in zip(cleaned_df["OrigRowNum"].tolist(), cleaned_df.index.tolist())
+                    if orig not in all_rows_to_exclude
+                }
+                col_map = {col: idx + 1 for idx, col in enumerate(cleaned_df.columns)}
+
+                for (row_idx, col_name), cell_data in flagged_cells_converted.items():
+                    if isinstance(cell_data, tuple):
+                        error_msg, orig_row_stored = cell_data
+                    else:
+                        error_msg = cell_data
+                        orig_row_stored = None
+                        if row_idx < len(cleaned_df):
+                            orig_row_stored = orig_rows[row_idx]
+
+                    if orig_row_stored and orig_row_stored not in all_rows_to_exclude:
+                        # Find Excel row position
+                        excel_row = orig_row_to_excel_row.get(orig_row_stored)
+
+                        if excel_row is not None and col_name in col_map:
                             excel_col = openpyxl.utils.get_column_letter(col_map[col_name])
 
                             # Determine priority using existing logic
@@ -429,11 +551,11 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
                             if cell_key not in temp_cell_fills or priority_level < temp_cell_fills[cell_key][0]:
                                 temp_cell_fills[cell_key] = (priority_level, fill_color)
 
-            # Assess file validation status
-            debug_print("Assessing file validation status...")
-            file_validation = assess_file_validation_status(
-                cleaned_df, temp_cell_fills, all_rows_to_exclude
-            )
+                # Assess file validation status
+                debug_print("Assessing file validation status...")
+                file_validation = assess_file_validation_status(
+                    cleaned_df, temp_cell_fills, all_rows_to_exclude
+                )
         
         # Update rows to exclude based on validation decision
         if file_validation['file_status'] == 'Valid' and file_validation['problematic_address_rows']:
@@ -441,12 +563,14 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
             all_rows_to_exclude.update(file_validation['problematic_address_rows'])
             
             # Add removed rows to invalid address removals for reporting
+            first_rows = cleaned_df.drop_duplicates('OrigRowNum')
+            addresses = first_rows['address'].tolist() if 'address' in first_rows.columns else [''] * len(first_rows)
+            address_by_orig_row = dict(zip(first_rows['OrigRowNum'].tolist(), addresses))
             for orig_row in file_validation['problematic_address_rows']:
-                if orig_row in cleaned_df['OrigRowNum'].values:
-                    row_data = cleaned_df[cleaned_df['OrigRowNum'] == orig_row].iloc[0]
+                if orig_row in address_by_orig_row:
                     invalid_address_removals_converted.append({
                         "OrigRowNum": int(orig_row),
-                        "address": str(row_data.get('address', '')),
+                        "address": str(address_by_orig_row[orig_row]),
                         "Error": "Address validation failed - removed per threshold policy"
                     })
 
@@ -459,8 +583,8 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
 
         summary = {
             "Total Rows Processed": int(len(cleaned_df) + len(pobox_errors_converted) + len(non_unique_row_removals_converted) + len(invalid_address_removals_converted) + len(duplicate_removals_converted)),
-            "Rows with Corrections": int(len(set(v["row"] for k, v in corrected_cells_converted.items() if v["status"] == "Valid" and v.get("row") in cleaned_df["OrigRowNum"].values))),
-            "Rows with Errors": int(len(set(error["Row"] for error in errors_converted if error["Row"] != "N/A" and int(error["Row"]) in cleaned_df["OrigRowNum"].values))),
+            "Rows with Corrections": int(len(set(v["row"] for k, v in corrected_cells_converted.items() if v["status"] == "Valid" and v.get("row") in orig_row_set))),
+            "Rows with Errors": int(len(set(error["Row"] for error in errors_converted if error["Row"] != "N/A" and int(error["Row"]) in orig_row_set))),
             "PO Box Rows Removed": int(len(pobox_errors_converted)),
             "Invalid Address Rows Removed": int(len(invalid_address_removals_converted)),
             "Duplicate Rows Removed (Full & Customer-based)": int(len(duplicate_removals_converted)),
@@ -490,7 +614,7 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
         # Build corrections data
         corrections_data = [
             {
-                "Row": int(cleaned_df["OrigRowNum"].iloc[row_idx]) if row_idx < len(cleaned_df) else "N/A",
+                "Row": int(orig_rows[row_idx]) if row_idx < len(orig_rows) else "N/A",
                 "Column": col_name,
                 "Original Value": info["original"],
                 "Corrected Value": info["corrected"],
@@ -503,87 +627,68 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
         # Load error dictionary
         error_dict = load_error_dictionary()
 
-        # Save Excel report
-        with pd.ExcelWriter(vr_excel_path, engine="openpyxl") as writer:
-            # Summary tab
-            pd.DataFrame(list(summary.items()), columns=["Metric", "Value"]).to_excel(writer, sheet_name="Summary", index=False)
-            
-            # Corrections tab
-            corrections_df = pd.DataFrame(corrections_data).sort_values(by=["Row", "Column"]) if corrections_data else pd.DataFrame(columns=["Row", "Column", "Original Value", "Corrected Value", "Correction Type", "Status"])
-            corrections_df.to_excel(writer, sheet_name="Corrections", index=False)
-            
-            # Smarty Processing Log tab
-            if smarty_corrections_data:
-                smarty_processing_log_df = pd.DataFrame(smarty_corrections_data).sort_values(by="OrigRowNum")
-            else:
-                smarty_processing_log_df = pd.DataFrame(columns=[
-                    "OrigRowNum",
-                    "Reason Sent",
-                    "Original Address",
-                    "Corrected Address",
-                    "Original City",
-                    "Corrected City",
-                    "Original State",
-                    "Corrected State",
-                    "Original ZIP",
-                    "Corrected ZIP",
-                    "Status",
-                    "Error Message",
-                    "Smarty Key",
-                    "Timestamp"
-                ])
-            smarty_processing_log_df.to_excel(writer, sheet_name="Smarty Processing Log", index=False)
-            
-            # Error Reference tab
-            if error_dict is not None:
-                error_dict.to_excel(writer, sheet_name="Error Reference", index=False)
-                debug_print(f"Added Error Reference tab with {len(error_dict)} entries")
-            else:
-                empty_ref_df = pd.DataFrame(columns=["Error_Message", "Column", "Category", "Description", "Resolution", "Severity"])
-                empty_ref_df.to_excel(writer, sheet_name="Error Reference", index=False)
-                debug_print("Created empty Error Reference tab (dictionary not found)")
-            
-            # Errors tab
-            filtered_errors_df = pd.DataFrame(filtered_errors_converted).sort_values(by=["Row", "Column"]) if filtered_errors_converted else pd.DataFrame(columns=["Row", "Column", "Error", "Value"])
-            filtered_errors_df.to_excel(writer, sheet_name="Errors", index=False)
-
-            # Critical Errors tab (NEW)
-            critical_errors_data = file_validation.get('critical_errors_detail', [])
-            if critical_errors_data:
-                critical_errors_df = pd.DataFrame(critical_errors_data).sort_values(by=["OrigRowNum", "Column"])
-                debug_print(f"Adding Critical Errors tab with {len(critical_errors_df)} entries")
-            else:
-                critical_errors_df = pd.DataFrame(columns=["OrigRowNum", "Column", "Error Type", "Current Value", "Severity"])
-                debug_print("Created empty Critical Errors tab (no critical errors found)")
-            critical_errors_df.to_excel(writer, sheet_name="Critical Errors", index=False)
+        # Build the Excel report tabs in order; they are written in one pass below.
+        # Tabs with no data are given as their column names only (header row, no DataFrame)
+        report_sheets = []
 
-            # Street Ending Errors tab
-            street_ending_df = pd.DataFrame(street_ending_errors).sort_values(by=["Row", "Column"]) if street_ending_errors else pd.DataFrame(columns=["Row", "Column", "Error", "Value"])
-            street_ending_df.to_excel(writer, sheet_name="Street Ending Errors", index=False)
-            
-            # PO Box Errors tab
-            pobox_df = pd.DataFrame(pobox_errors_converted).sort_values(by="Row") if pobox_errors_converted else pd.DataFrame(columns=["Row", "Column", "Error", "Value"])
-            pobox_df.to_excel(writer, sheet_name="PO Box Errors", index=False)
-            
-            # Invalid Address Removals tab
-            invalid_address_df = pd.DataFrame(invalid_address_removals_converted).sort_values(by="OrigRowNum") if invalid_address_removals_converted else pd.DataFrame(columns=["OrigRowNum", "address", "Error"])
-            invalid_address_df.to_excel(writer, sheet_name="Invalid Address Removals", index=False)
-            
-            # Non-Unique Row Removals tab
-            non_unique_df = pd.DataFrame(non_unique_row_removals_converted).sort_values(by="OrigRowNum") if non_unique_row_removals_converted else pd.DataFrame(columns=["OrigRowNum", "customer", "lat", "lon", "address", "city", "state", "zip", "download", "upload", "voip_lines_quantity", "business_customer", "technology", "Error"])
-            non_unique_df.to_excel(writer, sheet_name="Non-Unique Row Removals", index=False)
-
-            # Duplicate Rows Removed tab (exact duplicates and customer-based duplicates)
-            duplicate_removals_df = pd.DataFrame(duplicate_removals_converted).sort_values(by="OrigRowNum") if duplicate_removals_converted else pd.DataFrame(columns=["OrigRowNum", "Reason", "Duplicate_Of_Row", "Customer_ID", "Address", "Download_Speed", "Upload_Speed", "Technology"])
-            duplicate_removals_df.to_excel(writer, sheet_name="Duplicate Rows Removed", index=False)
-
-            # Auto-size columns for all sheets
-            wb = writer.book
-            for sheet in wb.sheetnames:
-                ws = wb[sheet]
-                for col in ws.columns:
-                    max_length = max(len(str(cell.value)) for cell in col if cell.value is not None)
-                    ws.column_dimensions[col[0].column_letter].width = min(max_length + 2, 50)
+        # Summary tab
+        report_sheets.append(("Summary", pd.DataFrame(list(summary.items()), columns=["Metric", "Value"])))
+        
+        # Corrections tab
+        corrections_df = pd.DataFrame(corrections_data).sort_values(by=["Row", "Column"]) if corrections_data else ["Row", "Column", "Original Value", "Corrected Value", "Correction Type", "Status"]
+        report_sheets.append(("Corrections", corrections_df))
+        
+        # Smarty Processing Log tab
+        if smarty_corrections_data:
+            smarty_processing_log_df = pd.DataFrame(smarty_corrections_data, columns=SMARTY_PROCESSING_LOG_COLUMNS).sort_values(by="OrigRowNum")
+        else:
+            smarty_processing_log_df = SMARTY_PROCESSING_LOG_COLUMNS
+        report_sheets.append(("Smarty Processing Log", smarty_processing_log_df))
+        
+        # Error Reference tab
+        if error_dict is not None:
+            report_sheets.append(("Error Reference", error_dict))
+            debug_print(f"Added Error Reference tab with {len(error_dict)} entries")
+        else:
+            empty_ref_columns = ["Error_Message", "Column", "Category", "Description", "Resolution", "Severity"]
+            report_sheets.append(("Error Reference", empty_ref_columns))
+            debug_print("Created empty Error Reference tab (dictionary not found)")
+        
+        # Errors tab
+        filtered_errors_df = pd.DataFrame(filtered_errors_converted).sort_values(by=["Row", "Column"]) if filtered_errors_converted else ["Row", "Column", "Error", "Value"]
+        report_sheets.append(("Errors", filtered_errors_df))
+
+        # Critical Errors tab (NEW)
+        critical_errors_data = file_validation.get('critical_errors_detail', [])
+        if critical_errors_data:
+            critical_errors_df = pd.DataFrame(critical_errors_data).sort_values(by=["OrigRowNum", "Column"])
+            debug_print(f"Adding Critical Errors tab with {len(critical_errors_df)} entries")
+        else:
+            critical_errors_df = ["OrigRowNum", "Column", "Error Type", "Current Value", "Severity"]
+            debug_print("Created empty Critical Errors tab (no critical errors found)")
+        report_sheets.append(("Critical Errors", critical_errors_df))
+
+        # Street Ending Errors tab
+        street_ending_df = pd.DataFrame(street_ending_errors).sort_values(by=["Row", "Column"]) if street_ending_errors else ["Row", "Column", "Error", "Value"]
+        report_sheets.append(("Street Ending Errors", street_ending_df))
+        
+        # PO Box Errors tab
+        pobox_df = pd.DataFrame(pobox_errors_converted).sort_values(by="Row") if pobox_errors_converted else ["Row", "Column", "Error", "Value"]
+        report_sheets.append(("PO Box Errors", pobox_df))
+        
+        # Invalid Address Removals tab
+        invalid_address_df = pd.DataFrame(invalid_address_removals_converted).sort_values(by="OrigRowNum") if invalid_address_removals_converted else ["OrigRowNum", "address", "Error"]
+        report_sheets.append(("Invalid Address Removals", invalid_address_df))
+        
+        # Non-Unique Row Removals tab
+        non_unique_df = pd.DataFrame(non_unique_row_removals_converted).sort_values(by="OrigRowNum") if non_unique_row_removals_converted else ["OrigRowNum", "customer", "lat", "lon", "address", "city", "state", "zip", "download", "upload", "voip_lines_quantity", "business_customer", "technology", "Error"]
+        report_sheets.append(("Non-Unique Row Removals", non_unique_df))
+
+        # Duplicate Rows Removed tab (exact duplicates and customer-based duplicates)
+        duplicate_removals_df = pd.DataFrame(duplicate_removals_converted).sort_values(by="OrigRowNum") if duplicate_removals_converted else ["OrigRowNum", "Reason", "Duplicate_Of_Row", "Customer_ID", "Address", "Download_Speed", "Upload_Speed", "Technology"]
+        report_sheets.append(("Duplicate Rows Removed", duplicate_removals_df))
+
+        write_report_workbook(vr_excel_path, report_sheets)
 
         # Save JSON report
         json_report = {
@@ -596,20 +701,27 @@ def generate_validation_report(cleaned_df, company_id, base_filename, errors, st
             "Invalid Address Removals": invalid_address_removals_converted,
             "Non-Unique Row Removals": non_unique_row_removals_converted,
             "Duplicate Rows Removed": duplicate_removals_converted,
-            "Smarty Corrections": smarty_corrections_data
+            "Smarty Corrections": convert_numpy_types(smarty_corrections_data)
         }
 
-        # Debug: Log JSON serialization attempt
-        debug_print(f"Attempting JSON serialization for {vr_json_path}, data size: {len(str(json_report))}")
+        # Serialize once and write the encoded bytes
+        debug_print("Attempting JSON serialization for %s", vr_json_path)
         try:
-            json.dumps(json_report, indent=4, ensure_ascii=False)
-            debug_print("JSON serialization successful")
+            if orjson is not None:
+                json_bytes = orjson.dumps(
+                    json_report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                # Same 2-space indent as OPT_INDENT_2, so the report does not depend on which engine is installed
+                json_bytes = json.dumps(json_report, indent=2, ensure_ascii=False).encode("utf-8")
+            debug_print("JSON serialization successful, data size: %s bytes", len(json_bytes))
         except Exception as e:
             debug_print(f"JSON serialization failed: {str(e)}")
             raise
 
-        with open(vr_json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_report, f, indent=4, ensure_ascii=False)
+        with open(vr_json_path, 'wb') as f:
+            f.write(json_bytes)
 
         debug_print(f"Successfully saved validation report: {vr_excel_path}, {vr_json_path}")
         debug_print(f"Final file status: {file_validation['file_status']}")
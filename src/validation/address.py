@@ -1,13 +1,77 @@
 """Address validation functions."""
 
 import re
+import functools
+from collections import Counter
 import pandas as pd
-from src.config.settings import PO_BOX, RURAL_ROUTES, STREET_ENDINGS, SPECIFIC_ROAD_PATTERN, FORBIDDEN_CHARS, VALID_STATES, NON_STANDARD_ENDINGS
+from src.config.settings import (
+    STREET_ENDINGS, VALID_STATES, PO_BOX_RE, RURAL_ROUTES_RE, SPECIFIC_ROAD_PATTERN_RE,
+    contains_forbidden, NON_STANDARD_ENDINGS_RE
+)
+from src.utils.file_handling import is_blank
 from src.utils.logging import debug_print
 from src.validation.smarty_validation import SMARTY_ELIGIBLE_ERRORS
 
-def append_error_with_tracking(error_msg, orig_row, col_name, value, idx, errors, flagged_cells):
-    """Append error and flag cell with OrigRowNum tracking."""
+# Patterns used by validate_address, compiled once at import instead of per call
+# Strip everything except word characters, whitespace and # & ! / ' (periods and double quotes included)
+_FORBIDDEN_ADDRESS_CHARS_RE = re.compile(r"[^\w\s#&!/']")
+# Full compass directions and their abbreviations, matched in one pass; the longer
+# intercardinal words are listed first in the alternation so NORTH never shadows NORTHEAST
+_COMPASS_ABBREVIATIONS = {
+    "NORTHEAST": "NE",
+    "NORTHWEST": "NW",
+    "SOUTHEAST": "SE",
+    "SOUTHWEST": "SW",
+    "NORTH": "N",
+    "SOUTH": "S",
+    "EAST": "E",
+    "WEST": "W"
+}
+_COMPASS_RE = re.compile(r"\b(" + "|".join(_COMPASS_ABBREVIATIONS) + r")\b", re.IGNORECASE)
+_NON_ADDRESS_RE = re.compile(r"\b(TBD|N/A|UNKNOWN)\b|\d{3}-\d{3}-\d{4}", re.IGNORECASE)
+# Literal parts of _NON_ADDRESS_RE; an address containing none of them (and no "-") cannot match it
+_NON_ADDRESS_TOKENS = ("TBD", "N/A", "UNKNOWN")
+_PR_TO_PVT_RD_RE = re.compile(r"(?i)\s+PR\s+")
+_FARM_TO_MARKET_ROAD_RE = re.compile(r"(?i)\bFarm\s*to\s*Market(?:\s*(?:Road|Rd))?\b")
+_FARM_TO_MARKET_RD_RE = re.compile(r"(?i)\bFarm\s*to\s*Market\s*Rd\b")
+# Optional directional prefix (with optional space) followed by one or more digits and optional letter suffix
+_LEADING_NUMBER_RE = re.compile(r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?[0-9]+[A-Z]?")
+_HOUSE_NUMBER_RE = re.compile(r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?\d+[A-Z]?")
+# Optional directional prefix, house number (with optional letter suffix), followed by street name (letters, spaces, hyphens, apostrophes)
+_STREET_NAME_RE = re.compile(r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?\d+[A-Z]?\s+[\w\s'-]+")
+# Street endings already include required leading space in the pattern
+_STREET_ENDING_RE = re.compile(rf"(?:{STREET_ENDINGS})(?:\s|$)", re.IGNORECASE)
+_STREET_ENDING_WITH_REST_RE = re.compile(rf"\s+(?:{STREET_ENDINGS})\.?(?:\s*$|\s+\S+)", re.IGNORECASE)
+# Kept on the stdlib engine rather than compile_linear_pattern: RE2's \b and \s are ASCII-only,
+# so street names such as "123 ÉLAN" would match differently depending on whether google-re2 is installed
+_FINAL_STREET_ENDING_RE = re.compile(rf"\s+(?:{STREET_ENDINGS})\b", re.IGNORECASE)
+_COMPASS_ENDING_RE = re.compile(r"\b(?:N|NE|E|SE|S|SW|W|NW)\s+\d+\s+(?:N|NE|E|SE|S|SW|W|NW)\b$", re.IGNORECASE)
+_NUMBER_NUMBER_COMPASS_RE = re.compile(r"\b\d+\s+\d+\s+(?:N|NE|E|SE|S|SW|W|NW)\b$", re.IGNORECASE)
+_PERMITTED_EXTENSION_RE = re.compile(
+    r"^(?:"
+    r"\b(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest)\b"
+    r"|(?:US|STATE)\s+(?:HWY|HIGHWAY|ROUTE|RT)\s+\d+"
+    r"|(?:US|STATE)\s+(?:HWY|HIGHWAY|ROUTE|RT)\s+\d+\s+(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest)"
+    r"|\d+\s+(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest)"
+    r"|\d+"  # Allow pure numeric extension (e.g., "140" after "CR")
+    r")(?:\s+(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest))?$",
+    re.IGNORECASE
+)
+# TOWER followed by a space and alphanumeric (like "TOWER 3" or "TOWER B") at end of address
+_TOWER_UNIT_RE = re.compile(r"\s+TOWER\s+[A-Z0-9][\w\-]*$", re.IGNORECASE)
+
+def error_keys(errors):
+    """Return the (Row, Column, Error) keys of errors, for duplicate checks in append_error_with_tracking."""
+    return {(e["Row"], e["Column"], e["Error"]) for e in errors}
+
+def append_error_with_tracking(error_msg, orig_row, col_name, value, idx, errors, flagged_cells, seen_errors=None):
+    """
+    Append error and flag cell with OrigRowNum tracking.
+
+    Callers appending many errors in a loop can pass seen_errors (built with error_keys(errors)
+    and only grown through this function) so the duplicate check is a set lookup instead of a
+    scan of the whole errors list.
+    """
     error_entry = {
         "Row": orig_row,
         "Column": col_name,
@@ -16,72 +80,105 @@ def append_error_with_tracking(error_msg, orig_row, col_name, value, idx, errors
     }
     
     # Check for duplicates
-    if not any(e["Row"] == error_entry["Row"] and e["Column"] == error_entry["Column"] and e["Error"] == error_entry["Error"] for e in errors):
+    if seen_errors is not None:
+        error_key = (orig_row, col_name, error_msg)
+        is_duplicate = error_key in seen_errors
+        seen_errors.add(error_key)
+    else:
+        is_duplicate = any(e["Row"] == error_entry["Row"] and e["Column"] == error_entry["Column"] and e["Error"] == error_entry["Error"] for e in errors)
+    if not is_duplicate:
         errors.append(error_entry)
         
         # Store OrigRowNum with the flagged cell (new format)
         flagged_cells[(idx, col_name)] = (error_msg, orig_row)
-        debug_print(f"Address error for OrigRowNum={orig_row}: {error_msg}, Value={value}")
+        debug_print("Address error for OrigRowNum=%s: %s, Value=%s", orig_row, error_msg, value)
+
+def _abbreviate_compass(match):
+    """Return the abbreviation for a _COMPASS_RE match."""
+    return _COMPASS_ABBREVIATIONS[match.group(1).upper()]
 
 def normalize_compass_directions(address):
     """Convert full compass directions to single letters."""
     if not address:
         return address
-    
-    # Dictionary for compass direction conversions
-    compass_conversions = {
-        r'\bNORTH\b': 'N',
-        r'\bSOUTH\b': 'S', 
-        r'\bEAST\b': 'E',
-        r'\bWEST\b': 'W',
-        r'\bNORTHEAST\b': 'NE',
-        r'\bNORTHWEST\b': 'NW',
-        r'\bSOUTHEAST\b': 'SE',
-        r'\bSOUTHWEST\b': 'SW'
-    }
-    
-    normalized_address = address
-    for pattern, replacement in compass_conversions.items():
-        normalized_address = re.sub(pattern, replacement, normalized_address, flags=re.IGNORECASE)
-    
-    return normalized_address
 
-def validate_address(address, orig_row, idx, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove, is_correction=False, non_standard_only=False, state=None):
-    """Validate an address and correct non-standard endings."""
-    debug_print(f"Validating address for OrigRowNum={orig_row}: '{address}' (is_correction={is_correction}, non_standard_only={non_standard_only})")
+    return _COMPASS_RE.sub(_abbreviate_compass, address)
+
+def _classify_ending(address):
+    """Return the specific-road, compass-ending and number-number-compass matches for an address."""
+    return (SPECIFIC_ROAD_PATTERN_RE.search(address), _COMPASS_ENDING_RE.search(address),
+            _NUMBER_NUMBER_COMPASS_RE.search(address))
+
+# Subscriber files repeat the same addresses (apartment buildings, templates), so the regex work is
+# memoized; validate_address replays the returned outcome against the per-row bookkeeping.
+# validate_subscriber_file clears the cache at the start of each file
+@functools.lru_cache(maxsize=131072)
+def _classify_address(address, is_pr, is_correction, non_standard_only, had_valid_correction):
+    """
+    Run the address checks without touching the shared error/correction structures.
+
+    Returns (is_valid, correction, errors, remove_row, pobox_error, steps): the last correction made as
+    a tuple of corrected_cells items (without "row"), the (error message, value) pairs raised in order,
+    whether the row is marked for removal, the PO Box (error message, value) pair, if any, and the
+    (message, args) debug steps taken. Nothing is logged here, so a cache hit still leaves a full trace;
+    each step message has an OrigRowNum=%s placeholder ahead of its own args.
+    """
     original_address = address
     validation_passed = True
+    correction = None
+    address_errors = []
+    remove_row = False
+    pobox_error = None
+    steps = []
 
     def append_error(error_msg):
-        """Append error with OrigRowNum tracking."""
-        append_error_with_tracking(error_msg, orig_row, "address", address, idx, errors, flagged_cells)
-
-    # Pre-filtering: Normalize whitespace
+        """Record an error against the current address."""
+        address_errors.append((error_msg, address))
+
+    def log_step(message, *args):
+        """Record a debug message; validate_address logs it with the row's OrigRowNum."""
+        steps.append((message, args))
+
+    def outcome(is_valid):
+        """Package the result returned to validate_address."""
+        return (is_valid, tuple(correction.items()) if correction else None, tuple(address_errors),
+                remove_row, pobox_error, tuple(steps))
+
+    # The street-ending checks below look at the same address several times; the ending
+    # matches are only recomputed once a correction has changed it
+    ending_cache = {}
+
+    def classify_ending():
+        """Return _classify_ending(address) for the current address."""
+        if address not in ending_cache:
+            ending_cache.clear()
+            ending_cache[address] = _classify_ending(address)
+        return ending_cache[address]
+
+    # Pre-filtering: Normalize whitespace (split/join collapses the same whitespace as \s+ without the regex engine)
     if pd.notna(address):
-        normalized_address = re.sub(r"\s+", " ", address.strip())
+        normalized_address = " ".join(address.split())
         address = normalized_address
-        debug_print(f"Normalized whitespace for OrigRowNum={orig_row}: '{original_address}' -> '{address}'")
+        log_step("Normalized whitespace for OrigRowNum=%s: '%s' -> '%s'", original_address, address)
 
     # Pre-filtering: Convert to uppercase
     if pd.notna(address):
         upper_address = address.upper()
         if upper_address != address:
-            corrected_cells[(idx, "address")] = {
-                "row": int(orig_row),
+            correction = {
                 "original": address,
                 "corrected": upper_address,
                 "type": "Case Normalization",
                 "status": "Valid"
             }
             address = upper_address
-            debug_print(f"Converted to uppercase for OrigRowNum={orig_row}: '{original_address}' -> '{address}'")
+            log_step("Converted to uppercase for OrigRowNum=%s: '%s' -> '%s'", original_address, address)
 
     # Pre-filtering: Remove unit designations BEFORE other validation
     # This prevents "#102" from interfering with street ending detection
     if pd.notna(address):
-        from src.config.settings import NON_STANDARD_ENDINGS
         pre_unit_removal = address
-        unit_match = re.search(NON_STANDARD_ENDINGS, address, re.IGNORECASE)
+        unit_match = NON_STANDARD_ENDINGS_RE.search(address)
         if unit_match:
             # Use the overall match start (includes the space/position before the unit designation)
             # The pattern (?:^|\s) matches space or start, so we need to check if there's a leading space
@@ -93,189 +190,163 @@ def validate_address(address, orig_row, idx, errors, corrected_cells, flagged_ce
             removed_part = address[match_start:]
             address = address[:match_start].strip()
             # Record this correction
-            corrected_cells[(idx, "address")] = {
-                "row": int(orig_row),
+            correction = {
                 "original": pre_unit_removal,
                 "corrected": address,
                 "type": "Unit Designation Removal (Pre-filter)",
                 "status": "Valid"
             }
-            debug_print(f"Pre-filtering: Removed unit designation for OrigRowNum={orig_row}: '{pre_unit_removal}' -> '{address}' (removed: '{removed_part}')")
+            log_step("Pre-filtering: Removed unit designation for OrigRowNum=%s: '%s' -> '%s' (removed: '%s')", pre_unit_removal, address, removed_part)
 
     # Pre-filtering: Remove forbidden characters (MOVED UP - before other processing)
     if pd.notna(address):
-        forbidden_chars_to_remove = r'[@$%*=<>\|\^~`\\\[\]{}\(\)\+".;,]|[^\w\s\.#&!/\'"]'
-        cleaned_address = re.sub(forbidden_chars_to_remove, '', address)
-        if cleaned_address != address:
-            debug_print(f"Removed forbidden characters for OrigRowNum={orig_row}: '{address}' -> '{cleaned_address}'")
+        cleaned_address, removed_count = _FORBIDDEN_ADDRESS_CHARS_RE.subn('', address)
+        if removed_count:
+            log_step("Removed forbidden characters for OrigRowNum=%s: '%s' -> '%s'", address, cleaned_address)
             address = cleaned_address
 
-    # Pre-filtering - Normalize compass directions
+    # Pre-filtering - Normalize compass directions (every match shortens the word, so a non-zero count means a change)
     if pd.notna(address):
         pre_compass_normalization = address
-        address = normalize_compass_directions(address)
-        if address != pre_compass_normalization:
-            corrected_cells[(idx, "address")] = {
-                "row": int(orig_row),
+        address, compass_count = _COMPASS_RE.subn(_abbreviate_compass, address)
+        if compass_count:
+            correction = {
                 "original": pre_compass_normalization,
                 "corrected": address,
                 "type": "Compass Direction Normalization",
                 "status": "Valid"
             }
-            debug_print(f"Normalized compass directions for OrigRowNum={orig_row}: '{pre_compass_normalization}' -> '{address}'")
+            log_step("Normalized compass directions for OrigRowNum=%s: '%s' -> '%s'", pre_compass_normalization, address)
 
     # NEW: Early exit for Puerto Rico (PR) addresses after basic cleanups
-    if pd.notna(state) and str(state).upper() == "PR":
+    if is_pr:
         # Record auto-accept for reporting
-        corrected_cells[(idx, "address")] = {
-            "row": int(orig_row),
+        correction = {
             "original": original_address,
             "corrected": address,  # Use the cleaned version
             "type": "PR Address Auto-Accept",
             "status": "Valid"
         }
-        debug_print(f"Auto-accepted PR address for OrigRowNum={orig_row}: '{address}'")
-        return True  # Skip all further validation
+        log_step("Auto-accepted PR address for OrigRowNum=%s: '%s'", address)
+        return outcome(True)  # Skip all further validation
 
     # Pre-filtering: Check minimum length
     if pd.notna(address) and len(address.replace(" ", "")) < 5:
         error_msg = "Corrected address is still invalid: Address too short" if is_correction else "Address too short"
         append_error(error_msg)
-        rows_to_remove.append(orig_row)
-        debug_print(f"Marked for removal due to short address for OrigRowNum={orig_row}: '{address}'")
-        return False
-
-    # Pre-filtering: Check for non-address patterns
-    if pd.notna(address):
-        non_address = re.search(r"\b(TBD|N/A|UNKNOWN)\b|\d{3}-\d{3}-\d{4}", address, re.IGNORECASE)
+        remove_row = True
+        log_step("Marked for removal due to short address for OrigRowNum=%s: '%s'", address)
+        return outcome(False)
+
+    # Pre-filtering: Check for non-address patterns. The address is upper-case by now, so plain
+    # substring tests rule out most rows before the regex runs
+    if pd.notna(address) and (any(token in address for token in _NON_ADDRESS_TOKENS) or "-" in address):
+        non_address = _NON_ADDRESS_RE.search(address)
         if non_address:
             error_msg = "Corrected address is still invalid: Non-address content detected" if is_correction else "Non-address content detected"
             append_error(error_msg)
-            rows_to_remove.append(orig_row)
-            debug_print(f"Marked for removal due to non-address content for OrigRowNum={orig_row}: '{address}'")
-            return False
+            remove_row = True
+            log_step("Marked for removal due to non-address content for OrigRowNum=%s: '%s'", address)
+            return outcome(False)
 
     # Pre-filtering: Convert PR to PVT RD - FIXED TO RECORD AS CORRECTION
     if pd.notna(address):
         pre_pr_conversion = address  # Store address before PR conversion
-        address = re.sub(r"(?i)\s+PR\s+", " PVT RD ", address.strip())
+        address = _PR_TO_PVT_RD_RE.sub(" PVT RD ", address.strip())
         if address != pre_pr_conversion:  # Compare with address just before PR conversion
             # FIXED: Record as correction instead of error
-            corrected_cells[(idx, "address")] = {
-                "row": int(orig_row),
+            correction = {
                 "original": pre_pr_conversion,
                 "corrected": address,
                 "type": "PR to PVT RD Conversion",
                 "status": "Valid"
             }
-            debug_print(f"PR converted to PVT RD for OrigRowNum={orig_row}: '{pre_pr_conversion}' -> '{address}'")
+            log_step("PR converted to PVT RD for OrigRowNum=%s: '%s' -> '%s'", pre_pr_conversion, address)
 
     # Pre-filtering: Convert Farm to Market patterns to FM
     if pd.notna(address):
         farm_to_market_original = address
         # Convert various Farm to Market patterns to FM
-        address = re.sub(r"(?i)\bFarm\s*to\s*Market(?:\s*(?:Road|Rd))?\b", "FM", address)
+        address, road_count = _FARM_TO_MARKET_ROAD_RE.subn("FM", address)
         # Also handle the specific "FARM TO MARKET RD" pattern
-        address = re.sub(r"(?i)\bFarm\s*to\s*Market\s*Rd\b", "FM", address)
+        address, rd_count = _FARM_TO_MARKET_RD_RE.subn("FM", address)
     
-        if address != farm_to_market_original:
-            corrected_cells[(idx, "address")] = {
-                "row": int(orig_row),
+        if road_count or rd_count:
+            correction = {
                 "original": farm_to_market_original,
                 "corrected": address,
                 "type": "Farm to Market to FM",
                 "status": "Valid"
             }
-            debug_print(f"Farm to Market converted to FM for OrigRowNum={orig_row}: '{farm_to_market_original}' -> '{address}'")
+            log_step("Farm to Market converted to FM for OrigRowNum=%s: '%s' -> '%s'", farm_to_market_original, address)
 
     # Check for blank or whitespace-only
     if not address or address.strip() == "":
         error_msg = "Corrected address is still invalid: Blank or whitespace-only value" if is_correction else "Blank or whitespace-only value"
         append_error(error_msg)
-        rows_to_remove.append(orig_row)
-        debug_print(f"Marked for removal due to blank address for OrigRowNum={orig_row}: '{address}'")
-        return False
+        remove_row = True
+        log_step("Marked for removal due to blank address for OrigRowNum=%s: '%s'", address)
+        return outcome(False)
 
     # Check for PO Box
-    if re.search(PO_BOX, address, re.IGNORECASE):
+    if PO_BOX_RE.search(address):
         error_msg = "Corrected address is still invalid: PO Boxes not allowed" if is_correction else "PO Boxes not allowed"
-        pobox_errors.append({
-            "Row": orig_row,
-            "Column": "address",
-            "Error": error_msg,
-            "Value": address
-        })
+        pobox_error = (error_msg, address)
         append_error(error_msg)
-        rows_to_remove.append(orig_row)
-        debug_print(f"Marked for removal due to PO Box for OrigRowNum={orig_row}: '{address}'")
-        return False
+        remove_row = True
+        log_step("Marked for removal due to PO Box for OrigRowNum=%s: '%s'", address)
+        return outcome(False)
 
     # Validate leading number and street name, allowing optional directional prefixes
     if pd.notna(address) and not is_correction:
-        # Regex: Optional directional prefix (with optional space) followed by one or more digits and optional letter suffix
-        leading_pattern = r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?[0-9]+[A-Z]?"
-        if not re.match(leading_pattern, address):
+        if not _LEADING_NUMBER_RE.match(address):
             error_msg = "Corrected address is still invalid: Address lacks leading number (optionally prefixed by direction) followed by street name" if is_correction else "Address lacks leading number (optionally prefixed by direction) followed by street name"
             append_error(error_msg)
-            rows_to_remove.append(orig_row)
-            debug_print(f"Marked for removal due to invalid leading number/street name for OrigRowNum={orig_row}: '{address}'")
-            return False
+            remove_row = True
+            log_step("Marked for removal due to invalid leading number/street name for OrigRowNum=%s: '%s'", address)
+            return outcome(False)
 
         # NEW PRIMARY LOGIC: Street ending validation and extension removal
     # Run the check in Phase 2 unless the address was corrected and validated in Phase 1
-    should_check_street_ending = non_standard_only or (not is_correction and ((idx, "address") not in corrected_cells or corrected_cells[(idx, "address")].get("status") != "Valid"))
+    has_valid_correction = had_valid_correction or correction is not None
+    should_check_street_ending = non_standard_only or (not is_correction and not has_valid_correction)
     if should_check_street_ending:
-        debug_print(f"Checking street ending for OrigRowNum={orig_row}: Address='{address}', non_standard_only={non_standard_only}, is_correction={is_correction}, corrected_cells_status={corrected_cells.get((idx, 'address'), {}).get('status', 'N/A')}")
+        log_step("Checking street ending for OrigRowNum=%s: Address='%s', non_standard_only=%s, is_correction=%s, corrected_cells_status=%s", address, non_standard_only, is_correction, "Valid" if has_valid_correction else "N/A")
 
         # NEW: Check if address matches SPECIFIC_ROAD_PATTERN (highways, county roads, etc.) first
-        specific_road_match = re.search(SPECIFIC_ROAD_PATTERN, address, re.IGNORECASE)
+        specific_road_match, compass_ending_match, number_number_compass_match = classify_ending()
         if specific_road_match:
-            debug_print(f"Specific road pattern matched for OrigRowNum={orig_row}: Address='{address}' (Highway/County Road/etc.)")
+            log_step("Specific road pattern matched for OrigRowNum=%s: Address='%s' (Highway/County Road/etc.)", address)
             validation_passed = True
         else:
-            # Street endings already include required leading space in the pattern
-            street_ending_matches = list(re.finditer(rf"(?:{STREET_ENDINGS})(?:\s|$)", address, re.IGNORECASE))
-            compass_ending_matches = list(re.finditer(r"\b(?:N|NE|E|SE|S|SW|W|NW)\s+\d+\s+(?:N|NE|E|SE|S|SW|W|NW)\b$", address, re.IGNORECASE))
-            number_number_compass_matches = list(re.finditer(r"\b\d+\s+\d+\s+(?:N|NE|E|SE|S|SW|W|NW)\b$", address, re.IGNORECASE))
+            street_ending_matches = list(_STREET_ENDING_RE.finditer(address))
 
             if street_ending_matches:
-                debug_print(f"Street ending matched for OrigRowNum={orig_row}: Matches={street_ending_matches}")
+                log_step("Street ending matched for OrigRowNum=%s: Matches=%s", street_ending_matches)
                 last_match = street_ending_matches[-1]
                 ending_end = last_match.end()
                 remaining = address[ending_end:].strip()
 
                 # Validate street name before the ending
                 address_before_ending = address[:last_match.start()].strip()
-                # Regex: Optional directional prefix, house number (with optional letter suffix), followed by street name (letters, spaces, hyphens, apostrophes)
-                street_name_pattern = r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?\d+[A-Z]?\s+[\w\s'-]+"
-                if re.match(street_name_pattern, address_before_ending):
-                    debug_print(f"Valid street name found for OrigRowNum={orig_row}: '{address_before_ending}'")
+                if _STREET_NAME_RE.match(address_before_ending):
+                    log_step("Valid street name found for OrigRowNum=%s: '%s'", address_before_ending)
                     validation_passed = True
                 else:
                     error_msg = "Invalid street name format before street ending"
                     append_error(error_msg)
                     validation_passed = False
-                    debug_print(f"Invalid street name for OrigRowNum={orig_row}: '{address_before_ending}'")
+                    log_step("Invalid street name for OrigRowNum=%s: '%s'", address_before_ending)
 
                 # Check for permitted extensions after street ending
                 if remaining:
-                    permitted_pattern = (
-                        r"^(?:"
-                        r"\b(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest)\b"
-                        r"|(?:US|STATE)\s+(?:HWY|HIGHWAY|ROUTE|RT)\s+\d+"
-                        r"|(?:US|STATE)\s+(?:HWY|HIGHWAY|ROUTE|RT)\s+\d+\s+(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest)"
-                        r"|\d+\s+(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest)"
-                        r"|\d+"  # Allow pure numeric extension (e.g., "140" after "CR")
-                        r")(?:\s+(?:N|S|E|W|NE|NW|SE|SW|North|South|East|West|Northeast|Northwest|Southeast|Southwest))?$"
-                    )
-                    is_permitted = re.match(permitted_pattern, remaining, re.IGNORECASE)
+                    is_permitted = _PERMITTED_EXTENSION_RE.match(remaining)
                     if is_permitted:
                         validation_passed = True
-                        debug_print(f"Permitted extension after street ending for OrigRowNum={orig_row}: '{remaining}'")
+                        log_step("Permitted extension after street ending for OrigRowNum=%s: '%s'", remaining)
                     else:
                         corrected_address = address[:ending_end].strip()
-                        corrected_cells[(idx, "address")] = {
-                            "row": int(orig_row),
+                        correction = {
                             "original": address,
                             "corrected": corrected_address,
                             "type": "Non-Permitted Extension Removal After Street Ending",
@@ -284,167 +355,200 @@ def validate_address(address, orig_row, idx, errors, corrected_cells, flagged_ce
                         }
                         address = corrected_address
                         validation_passed = True
-                        debug_print(f"Removed non-permitted extension after street ending for OrigRowNum={orig_row}: '{remaining}' -> Result: '{address}'")
-            elif compass_ending_matches:
-                debug_print(f"Compass pattern matched for OrigRowNum={orig_row}: Address='{address}'")
+                        log_step("Removed non-permitted extension after street ending for OrigRowNum=%s: '%s' -> Result: '%s'", remaining, address)
+            elif compass_ending_match:
+                log_step("Compass pattern matched for OrigRowNum=%s: Address='%s'", address)
                 validation_passed = True
-            elif number_number_compass_matches:
-                debug_print(f"Number-number-compass pattern matched for OrigRowNum={orig_row}: Address='{address}'")
+            elif number_number_compass_match:
+                log_step("Number-number-compass pattern matched for OrigRowNum=%s: Address='%s'", address)
                 validation_passed = True
             else:
                 error_msg = "Corrected address is still invalid: Lacks standard street ending" if is_correction else "Lacks standard street ending"
                 append_error(error_msg)
-                debug_print(f"No street ending or compass pattern match for OrigRowNum={orig_row}: Address='{address}'")
+                log_step("No street ending or compass pattern match for OrigRowNum=%s: Address='%s'", address)
                 validation_passed = False
 
     # Check for and remove non-standard endings only if street name is valid
-    from src.config.settings import NON_STANDARD_ENDINGS
     if validation_passed:  # Only proceed if the address has a valid street name or ending
-        non_standard_match = re.search(NON_STANDARD_ENDINGS, address, re.IGNORECASE)
+        non_standard_match = NON_STANDARD_ENDINGS_RE.search(address)
         if non_standard_match:
             corrected_address = address[:non_standard_match.start(1)].strip()
-            debug_print(f"DEBUG: Non-standard ending found in '{address}'")
-            debug_print(f"DEBUG: Match groups: {non_standard_match.groups()}")
-            debug_print(f"DEBUG: Corrected address: '{corrected_address}'")
+            log_step("DEBUG: Non-standard ending found for OrigRowNum=%s in '%s'", address)
+            log_step("DEBUG: Match groups for OrigRowNum=%s: %s", non_standard_match.groups())
+            log_step("DEBUG: Corrected address for OrigRowNum=%s: '%s'", corrected_address)
             # Ensure the corrected address still has a valid street name (allow letter suffix on house number)
-            street_name_check = re.match(r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?\d+[A-Z]?\s+[\w\s\-']+", corrected_address)
-            debug_print(f"DEBUG: Street name check result: {street_name_check is not None}")
+            street_name_check = _STREET_NAME_RE.match(corrected_address)
+            log_step("DEBUG: Street name check result for OrigRowNum=%s: %s", street_name_check is not None)
             if street_name_check:
-                corrected_cells[(idx, "address")] = {
-                    "row": int(orig_row),
+                correction = {
                     "original": address,
                     "corrected": corrected_address,
                     "type": "Non-Standard Ending Removal",
                     "status": "Valid"
                 }
-                debug_print(f"Removed non-standard ending for OrigRowNum={orig_row}: '{address}' -> '{corrected_address}'")
+                log_step("Removed non-standard ending for OrigRowNum=%s: '%s' -> '%s'", address, corrected_address)
                 address = corrected_address
             else:
                 error_msg = "Corrected address lacks valid street name after non-standard ending removal"
                 append_error(error_msg)
                 validation_passed = False
-                debug_print(f"Invalid corrected address after non-standard ending removal for OrigRowNum={orig_row}: '{corrected_address}'")
+                log_step("Invalid corrected address after non-standard ending removal for OrigRowNum=%s: '%s'", corrected_address)
 
     # TOWER-specific handling: Only remove TOWER if it appears AFTER a street ending with a number
     # This prevents "31942 TOWER RD" from being incorrectly flagged while catching "321 PINE RD TOWER 3"
     if validation_passed:
-        # Pattern: Finds TOWER followed by a space and alphanumeric (like "TOWER 3" or "TOWER B") at end of address
-        tower_unit_pattern = r"\s+TOWER\s+[A-Z0-9][\w\-]*$"
-        tower_match = re.search(tower_unit_pattern, address, re.IGNORECASE)
+        tower_match = _TOWER_UNIT_RE.search(address)
 
         if tower_match:
             # Verify there's a valid street ending before TOWER
             address_before_tower = address[:tower_match.start()].strip()
 
             # Check if address before TOWER ends with a street ending
-            if re.search(rf"(?:{STREET_ENDINGS})(?:\s|$)", address_before_tower, re.IGNORECASE):
+            if _STREET_ENDING_RE.search(address_before_tower):
                 corrected_address = address_before_tower
-                corrected_cells[(idx, "address")] = {
-                    "row": int(orig_row),
+                correction = {
                     "original": address,
                     "corrected": corrected_address,
                     "type": "TOWER Unit Designation Removal",
                     "status": "Valid"
                 }
-                debug_print(f"Removed TOWER unit designation for OrigRowNum={orig_row}: '{address}' -> '{corrected_address}'")
+                log_step("Removed TOWER unit designation for OrigRowNum=%s: '%s' -> '%s'", address, corrected_address)
                 address = corrected_address
             else:
-                debug_print(f"TOWER found but no street ending before it in '{address}' - keeping as-is")
+                log_step("TOWER found for OrigRowNum=%s but no street ending before it in '%s' - keeping as-is", address)
 
     # Additional checks for rural routes or specific road patterns
-    if re.search(RURAL_ROUTES, address, re.IGNORECASE) or re.search(SPECIFIC_ROAD_PATTERN, address, re.IGNORECASE):
-        debug_print(f"Matches RURAL_ROUTES or SPECIFIC_ROAD_PATTERN for OrigRowNum={orig_row}: '{address}'")
+    if RURAL_ROUTES_RE.search(address) or classify_ending()[0]:
+        log_step("Matches RURAL_ROUTES or SPECIFIC_ROAD_PATTERN for OrigRowNum=%s: '%s'", address)
         # Don't override previous failure due to missing street ending
         if validation_passed:
-            return True
+            return outcome(True)
 
     # Check for house number if street ending exists, allowing optional directional prefixes
-    street_ending_match = re.search(rf"\s+(?:{STREET_ENDINGS})\.?(?:\s*$|\s+\S+)", address, re.IGNORECASE)
+    street_ending_match = _STREET_ENDING_WITH_REST_RE.search(address)
     if street_ending_match:
         address_before_ending = address[:street_ending_match.start()].strip()
-        # Regex: Optional directional prefix (with optional space) followed by one or more digits and optional letter suffix
-        house_number_pattern = r"(?i)^(?:(N|S|E|W|NE|NW|SE|SW)\s?)?\d+[A-Z]?"
-        if not re.search(house_number_pattern, address_before_ending):
+        if not _HOUSE_NUMBER_RE.search(address_before_ending):
             error_msg = f"Corrected address is still invalid: No house number (optionally prefixed by direction)" if is_correction else "No house number (optionally prefixed by direction)"
             append_error(error_msg)
-            rows_to_remove.append(orig_row)
-            debug_print(f"Marked for removal due to no house number for OrigRowNum={orig_row}: '{address}'")
-            return False
+            remove_row = True
+            log_step("Marked for removal due to no house number for OrigRowNum=%s: '%s'", address)
+            return outcome(False)
 
     # Check for forbidden characters (MOVED TO TOP - this is now redundant but kept for safety)
-    forbidden = re.search(FORBIDDEN_CHARS, address)
+    forbidden = contains_forbidden(address)
     if forbidden:
         error_msg = "Corrected address is still invalid: Invalid format" if is_correction else "Invalid format"
         append_error(error_msg)
         # Row will be sent to Smarty for validation instead of immediate removal
-        debug_print(f"Flagged for Smarty validation due to invalid format for OrigRowNum={orig_row}: '{address}'")
-        return False
+        log_step("Flagged for Smarty validation due to invalid format for OrigRowNum=%s: '%s'", address)
+        return outcome(False)
 
     # If this address was corrected by Smarty, skip all further validation
     # Smarty is the authoritative source - if it validated the address, we accept it
     if is_correction:
-        debug_print(f"Address corrected by Smarty for OrigRowNum={orig_row}: '{address}' - skipping further validation (Smarty is authoritative)")
-        return True
+        log_step("Address corrected by Smarty for OrigRowNum=%s: '%s' - skipping further validation (Smarty is authoritative)", address)
+        return outcome(True)
 
     # Final street ending check for non-Smarty addresses
     # NEW: Check if address matches SPECIFIC_ROAD_PATTERN (highways, county roads, etc.) first
-    specific_road_match = re.search(SPECIFIC_ROAD_PATTERN, address, re.IGNORECASE)
+    specific_road_match, compass_ending_match, number_number_compass_match = classify_ending()
 
     if not specific_road_match:
         # Only check for standard street endings if it's not a specific road type
-        final_street_ending_matches = list(re.finditer(rf"\s+(?:{STREET_ENDINGS})\b", address, re.IGNORECASE))
-        compass_ending_matches = list(re.finditer(r"\b(?:N|NE|E|SE|S|SW|W|NW)\s+\d+\s+(?:N|NE|E|SE|S|SW|W|NW)\b$", address, re.IGNORECASE))
-        number_number_compass_matches = list(re.finditer(r"\b\d+\s+\d+\s+(?:N|NE|E|SE|S|SW|W|NW)\b$", address, re.IGNORECASE))
-
-        if not final_street_ending_matches and not compass_ending_matches and not number_number_compass_matches:
+        if not _FINAL_STREET_ENDING_RE.search(address) and not compass_ending_match and not number_number_compass_match:
             error_msg = "Lacks standard street ending"
             append_error(error_msg)
-            debug_print(f"Final check: No street ending or compass pattern match for OrigRowNum={orig_row}: Address='{address}'")
+            log_step("Final check: No street ending or compass pattern match for OrigRowNum=%s: Address='%s'", address)
             validation_passed = False
     else:
-        debug_print(f"Final check: Specific road pattern matched for OrigRowNum={orig_row}: Address='{address}' (Highway/County Road/etc.) - skipping standard ending check")
+        log_step("Final check: Specific road pattern matched for OrigRowNum=%s: Address='%s' (Highway/County Road/etc.) - skipping standard ending check", address)
 
-    return validation_passed
+    return outcome(validation_passed)
+
+
+def validate_address(address, orig_row, idx, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove, is_correction=False, non_standard_only=False, state=None, seen_errors=None):
+    """Validate an address and correct non-standard endings."""
+    debug_print("Validating address for OrigRowNum=%s: '%s' (is_correction=%s, non_standard_only=%s)", orig_row, address, is_correction, non_standard_only)
+    prior_correction = corrected_cells.get((idx, "address"))
+    is_valid, correction, address_errors, remove_row, pobox_error, steps = _classify_address(
+        address, pd.notna(state) and str(state).upper() == "PR", is_correction, non_standard_only,
+        prior_correction is not None and prior_correction.get("status") == "Valid"
+    )
+    for message, args in steps:
+        debug_print(message, orig_row, *args)
+
+    if correction is not None:
+        corrected_cells[(idx, "address")] = {"row": int(orig_row), **dict(correction)}
+    if pobox_error is not None:
+        pobox_errors.append({
+            "Row": orig_row,
+            "Column": "address",
+            "Error": pobox_error[0],
+            "Value": pobox_error[1]
+        })
+    for error_msg, value in address_errors:
+        append_error_with_tracking(error_msg, orig_row, "address", value, idx, errors, flagged_cells, seen_errors)
+    if remove_row:
+        rows_to_remove.append(orig_row)
+    return is_valid
 
 
 # Updated validate_address_column in address.py
 def validate_address_column(cleaned_df, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove):
-    for idx, val in enumerate(cleaned_df["address"].fillna("").astype(str).str.strip()):
-        orig_row = cleaned_df["OrigRowNum"][idx]
-
-        # Check if ALL address fields are empty (GPS-only row)
-        address_empty = not val or val.strip() == ""
-        city_empty = pd.isna(cleaned_df["city"].iloc[idx]) or str(cleaned_df["city"].iloc[idx]).strip() == ""
-        state_empty = pd.isna(cleaned_df["state"].iloc[idx]) or str(cleaned_df["state"].iloc[idx]).strip() == ""
-        zip_empty = pd.isna(cleaned_df["zip"].iloc[idx]) or str(cleaned_df["zip"].iloc[idx]).strip() == ""
+    # Columns are pulled out once and read by position in the loop; GPS-only rows
+    # (ALL address fields empty) are found column-wise, the same way as Phase 1
+    addresses = cleaned_df["address"].fillna("").astype(str).str.strip()
+    gps_only = (addresses.eq("") & is_blank(cleaned_df["city"]) & is_blank(cleaned_df["state"]) &
+                is_blank(cleaned_df["zip"])).to_numpy()
+    orig_rows = cleaned_df["OrigRowNum"].to_numpy()
+    states = cleaned_df["state"].tolist()
+    # Smarty-eligible address errors raised before this pass, counted per row for the debug log
+    smarty_error_counts = Counter(e["Row"] for e in errors if e["Column"] == "address" and e["Error"] in SMARTY_ELIGIBLE_ERRORS)
+    # Rows that validate cleanly have their Smarty-eligible errors dropped in one pass after the loop,
+    # and valid corrections are written back in one assignment
+    cleared_rows = set()
+    address_updates = {}
+    # errors only grows through validate_address inside the loop, so duplicates are tracked in a set
+    seen_errors = error_keys(errors)
+    for idx, val in enumerate(addresses.tolist()):
+        orig_row = orig_rows[idx]
 
         # If ALL address fields are empty, skip address validation (GPS-only row)
-        if address_empty and city_empty and state_empty and zip_empty:
-            debug_print(f"Skipping address validation for OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
+        if gps_only[idx]:
+            debug_print("Skipping address validation for OrigRowNum=%s: All address fields empty (GPS-only row)", orig_row)
             continue
 
-        state = cleaned_df["state"][idx]
-        is_valid = validate_address(val, orig_row, idx, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove, is_correction=False, non_standard_only=False, state=state)
+        state = states[idx]
+        errors_before = len(errors)
+        is_valid = validate_address(val, orig_row, idx, errors, corrected_cells, flagged_cells, pobox_errors, rows_to_remove, is_correction=False, non_standard_only=False, state=state, seen_errors=seen_errors)
 
         # If validation passed, clear any previous Smarty-eligible errors
         if is_valid:
             # Check if there were any Smarty-eligible errors before clearing
-            smarty_errors_before = [e for e in errors if e["Row"] == orig_row and e["Column"] == "address" and e["Error"] in SMARTY_ELIGIBLE_ERRORS]
+            smarty_errors_before = smarty_error_counts[orig_row] + sum(
+                1 for e in errors[errors_before:] if e["Column"] == "address" and e["Error"] in SMARTY_ELIGIBLE_ERRORS
+            )
             if smarty_errors_before:
-                debug_print(f"Phase 2: Address '{val}' OrigRowNum={orig_row} is valid - clearing {len(smarty_errors_before)} Smarty-eligible errors")
+                debug_print("Phase 2: Address '%s' OrigRowNum=%s is valid - clearing %s Smarty-eligible errors", val, orig_row, smarty_errors_before)
 
-            errors[:] = [e for e in errors if not (e["Row"] == orig_row and e["Column"] == "address" and e["Error"] in SMARTY_ELIGIBLE_ERRORS)]
+            cleared_rows.add(orig_row)
 
             # Also clear from flagged_cells to prevent sending to Smarty
             if (idx, "address") in flagged_cells:
                 flagged_error = flagged_cells[(idx, "address")]
-                debug_print(f"Phase 2: Clearing flagged_cells for OrigRowNum={orig_row}, address '{val}' - was flagged with: {flagged_error}")
+                debug_print("Phase 2: Clearing flagged_cells for OrigRowNum=%s, address '%s' - was flagged with: %s", orig_row, val, flagged_error)
                 del flagged_cells[(idx, "address")]
             else:
-                debug_print(f"Phase 2: Address '{val}' OrigRowNum={orig_row} passed validation - not in flagged_cells")
+                debug_print("Phase 2: Address '%s' OrigRowNum=%s passed validation - not in flagged_cells", val, orig_row)
 
-        # Apply correction immediately if valid
+        # Apply correction if valid
         if (idx, "address") in corrected_cells and corrected_cells[(idx, "address")].get("status") == "Valid":
-            cleaned_df.loc[idx, "address"] = corrected_cells[(idx, "address")]["corrected"]
-            debug_print(f"Applied address correction for OrigRowNum={orig_row}: '{val}' -> '{corrected_cells[(idx, 'address')]['corrected']}'")
-            debug_print(f"Cleared Smarty-eligible address errors for OrigRowNum={orig_row} after valid local correction")
\ No newline at end of file
+            address_updates[idx] = corrected_cells[(idx, "address")]["corrected"]
+            debug_print("Applied address correction for OrigRowNum=%s: '%s' -> '%s'", orig_row, val, corrected_cells[(idx, 'address')]['corrected'])
+            debug_print("Cleared Smarty-eligible address errors for OrigRowNum=%s after valid local correction", orig_row)
+
+    if cleared_rows:
+        errors[:] = [e for e in errors if not (e["Row"] in cleared_rows and e["Column"] == "address" and e["Error"] in SMARTY_ELIGIBLE_ERRORS)]
+    if address_updates:
+        cleaned_df.loc[list(address_updates), "address"] = list(address_updates.values())
\ No newline at end of file
@@ -1,9 +1,46 @@
 """Coordinate (latitude/longitude) validation functions."""
 
+import numpy as np
 import pandas as pd
-from src.config.settings import STATE_LAT_RANGES, STATE_LON_RANGES
+from src.config.settings import VALID_STATES_ORDERED, STATE_LAT_RANGES, STATE_LON_RANGES
 from src.utils.logging import debug_print
 
+# Packed state bounds for vectorized checks: one row per state in VALID_STATES_ORDERED
+# Columns: lon_min, lon_max, lat_min, lat_max
+STATE_CODE_TO_IDX = {code: i for i, code in enumerate(VALID_STATES_ORDERED)}
+STATE_BOUNDS = np.array(
+    [STATE_LON_RANGES[code] + STATE_LAT_RANGES[code] for code in VALID_STATES_ORDERED],
+    dtype=np.float64
+)
+# Contiguous per-column copies (struct-of-arrays) so each bounds check gathers from one array
+STATE_LON_LO, STATE_LON_HI, STATE_LAT_LO, STATE_LAT_HI = (
+    np.ascontiguousarray(STATE_BOUNDS[:, i]) for i in range(4)
+)
+
+
+def check_in_state_bounds(state_codes, lon, lat):
+    """
+    Check many coordinates against their state's bounding box in one pass.
+
+    Args:
+        state_codes (array-like): Uppercase state abbreviations, one per row
+        lon (array-like): Longitudes (NaN allowed)
+        lat (array-like): Latitudes (NaN allowed)
+
+    Returns:
+        np.ndarray: Boolean mask, True where the state is known and both coordinates
+            fall inside its range. Unknown states and NaN coordinates give False.
+    """
+    state_idx = np.fromiter((STATE_CODE_TO_IDX.get(code, -1) for code in state_codes), dtype=np.intp, count=len(state_codes))
+    known_state = state_idx >= 0
+    state_idx = np.where(known_state, state_idx, 0)
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    return (known_state &
+            (lon >= STATE_LON_LO[state_idx]) & (lon <= STATE_LON_HI[state_idx]) &
+            (lat >= STATE_LAT_LO[state_idx]) & (lat <= STATE_LAT_HI[state_idx]))
+
+
 def append_coordinate_error_with_tracking(error_msg, orig_row, col_name, value, idx, errors, flagged_cells):
     """Append error and flag cell with OrigRowNum tracking for coordinate validation."""
     error_entry = {
@@ -19,7 +56,7 @@ def append_coordinate_error_with_tracking(error_msg, orig_row, col_name, value,
         
         # Store OrigRowNum with the flagged cell (new format)
         flagged_cells[(idx, col_name)] = (error_msg, orig_row)
-        debug_print(f"Coordinate validation error for OrigRowNum={orig_row}, col={col_name}: {error_msg}")
+        debug_print("Coordinate validation error for OrigRowNum=%s, col=%s: %s", orig_row, col_name, error_msg)
 
 def is_float(value):
     """Check if a value can be converted to float."""
@@ -39,7 +76,7 @@ def reset_paired_coordinate(cleaned_df, idx, col, orig_row, errors, corrected_ce
     if pd.notna(paired_val):
         cleaned_df.loc[idx, paired_col] = pd.NA
         corrected_cells[(idx, paired_col)] = {
-            "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+            "row": int(orig_row),
             "original": paired_val,
             "corrected": None,
             "type": "Paired Coordinate Reset",
@@ -50,11 +87,20 @@ def reset_paired_coordinate(cleaned_df, idx, col, orig_row, errors, corrected_ce
 
 def validate_coordinates(cleaned_df, errors, corrected_cells, flagged_cells):
     """Validate latitude and longitude columns."""
-    for idx, row in cleaned_df.iterrows():
-        orig_row = row["OrigRowNum"]
-        state = row["state"].strip().upper() if pd.notna(row["state"]) else ""
-        for col in ["lat", "lon"]:
-            val = row[col]
+    # Rows whose lat/lon already sit inside their state's range need no per-row checks
+    states = cleaned_df["state"].fillna("").astype(str).str.strip().str.upper()
+    lon_values = pd.to_numeric(cleaned_df["lon"], errors="coerce")
+    lat_values = pd.to_numeric(cleaned_df["lat"], errors="coerce")
+    in_bounds = check_in_state_bounds(states.to_numpy(), lon_values.to_numpy(), lat_values.to_numpy())
+    # Positive AK longitudes are inside the AK range but still rejected by validate_coordinate_value
+    in_bounds &= ~((states == "AK") & (lon_values > 0)).to_numpy()
+    orig_rows = cleaned_df["OrigRowNum"].to_numpy()
+    debug_print("Coordinates: %s of %s rows within state bounds, checking the rest individually", int(in_bounds.sum()), len(cleaned_df))
+
+    out_of_bounds = cleaned_df.loc[~in_bounds, ["OrigRowNum", "state", "lat", "lon"]]
+    for idx, orig_row, state_val, lat_val, lon_val in out_of_bounds.itertuples(name=None):
+        state = state_val.strip().upper() if pd.notna(state_val) else ""
+        for col, val in (("lat", lat_val), ("lon", lon_val)):
             if pd.isna(val) or val == "":
                 continue
             if not is_float(val):
@@ -64,7 +110,7 @@ def validate_coordinates(cleaned_df, errors, corrected_cells, flagged_cells):
                     cleaned_df.loc[idx, col] = float_val
                     is_valid, error_msg = validate_coordinate_value(float_val, col, state)
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": float_val,
                         "type": "Float Conversion",
@@ -75,7 +121,7 @@ def validate_coordinates(cleaned_df, errors, corrected_cells, flagged_cells):
                 except ValueError:
                     cleaned_df.loc[idx, col] = pd.NA
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": None,
                         "type": "Invalid Value Replacement",
@@ -95,7 +141,7 @@ def validate_coordinates(cleaned_df, errors, corrected_cells, flagged_cells):
                         if is_valid:
                             cleaned_df.loc[idx, col] = corrected_val
                             corrected_cells[(idx, col)] = {
-                                "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                                "row": int(orig_rows[idx]),
                                 "original": val,
                                 "corrected": corrected_val,
                                 "type": "Sign Flip",
@@ -104,7 +150,7 @@ def validate_coordinates(cleaned_df, errors, corrected_cells, flagged_cells):
                         else:
                             cleaned_df.loc[idx, col] = pd.NA
                             corrected_cells[(idx, col)] = {
-                                "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                                "row": int(orig_rows[idx]),
                                 "original": val,
                                 "corrected": None,
                                 "type": "Invalid Value Replacement",
@@ -115,7 +161,7 @@ def validate_coordinates(cleaned_df, errors, corrected_cells, flagged_cells):
                     else:
                         cleaned_df.loc[idx, col] = pd.NA
                         corrected_cells[(idx, col)] = {
-                            "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                            "row": int(orig_rows[idx]),
                             "original": val,
                             "corrected": None,
                             "type": "Invalid Value Replacement",
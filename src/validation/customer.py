@@ -7,7 +7,7 @@ from src.utils.logging import debug_print
 def validate_customer_uniqueness(cleaned_df, errors, rows_to_remove, non_unique_row_removals, corrected_cells, flagged_cells):
     """Ensure customer IDs are unique by renaming duplicates."""
     debug_print("=== Starting customer uniqueness validation ===")
-    debug_print(f"Customer values: {cleaned_df['customer'].tolist()}")
+    debug_print("Customer values: %s", cleaned_df['customer'].tolist())
     cleaned_df["customer"] = cleaned_df["customer"].astype(str)
     cleaned_df["customer_lower"] = cleaned_df["customer"].str.lower().fillna("")
     comparison_columns = ["lat", "lon", "address", "city", "state", "zip", "download", "upload",
@@ -26,7 +26,7 @@ def validate_customer_uniqueness(cleaned_df, errors, rows_to_remove, non_unique_
     grouped = cleaned_df.groupby("customer_lower")
     for customer_lower, group in grouped:
         if len(group) > 1:
-            debug_print(f"Duplicate customer ID '{customer_lower}' at OrigRowNum={group['OrigRowNum'].tolist()}")
+            debug_print("Duplicate customer ID '%s' at OrigRowNum=%s", customer_lower, group['OrigRowNum'].tolist())
             group = group.reset_index()
             orig_row_to_new_name = {}
 
@@ -78,54 +78,51 @@ def validate_data_based_duplicates(cleaned_df, errors, rows_to_remove, non_uniqu
     comparison_columns = ["lat", "lon", "address", "city", "state", "zip", "download", "upload",
                          "voip_lines_quantity", "business_customer", "technology"]
 
-    # Create composite key from all data fields (excluding customer ID)
-    cleaned_df["temp_data_key"] = cleaned_df[comparison_columns].astype(str).agg('|'.join, axis=1)
+    # Create composite key from all data fields (excluding customer ID); str.cat joins the
+    # columns in one vectorized pass instead of a per-row agg
+    data_columns = cleaned_df[comparison_columns].astype(str)
+    data_key = data_columns[comparison_columns[0]].str.cat([data_columns[col] for col in comparison_columns[1:]], sep="|")
+
+    # Only rows whose key occurs more than once need grouping
+    dup_mask = data_key.duplicated(keep=False)
+    if not dup_mask.any():
+        return
 
     # Group by data signature
-    grouped = cleaned_df.groupby("temp_data_key")
+    grouped = cleaned_df[dup_mask].groupby(data_key[dup_mask])
     suffix_counter = 1
 
     for data_key, group in grouped:
-        if len(group) > 1:
-            debug_print(f"Found {len(group)} rows with identical data: customers {group['customer'].tolist()}")
-
-            # Keep first occurrence with original customer ID, rename others
-            for i in range(1, len(group)):  # Skip first (index 0)
-                row = group.iloc[i]
-                orig_row = row["OrigRowNum"]
-                original_customer_id = row["customer"]
-                first_customer_id = group.iloc[0]["customer"]
-
-                # Generate new unique customer ID
-                new_customer_id = f"{original_customer_id}_{suffix_counter:03d}"
-                suffix_counter += 1
-
-                # Update the customer ID in the dataframe
-                idx = cleaned_df.index[cleaned_df["OrigRowNum"] == orig_row].tolist()
-                if idx:
-                    cleaned_df.loc[idx[0], "customer"] = new_customer_id
-
-                # Mark as corrected
-                corrected_cells[(idx[0], "customer")] = {
-                    "row": int(orig_row),
-                    "original": original_customer_id,
-                    "corrected": new_customer_id,
-                    "type": "Data-based Duplicate Rename",
-                    "status": "Valid"
-                }
-
-                # Add error entry
-                errors.append({
-                    "Row": orig_row,
-                    "Column": "customer",
-                    "Error": f"Data-based duplicate, renamed to {new_customer_id} (identical data to customer {first_customer_id})",
-                    "Value": original_customer_id
-                })
-
-                debug_print(f"Renamed customer {original_customer_id} to {new_customer_id} (OrigRowNum {orig_row}) - identical data to customer {first_customer_id}")
+        debug_print("Found %s rows with identical data: customers %s", len(group), group['customer'].tolist())
+        first_customer_id = group["customer"].iloc[0]
+
+        # Keep first occurrence with original customer ID, rename others
+        for idx, orig_row, original_customer_id in zip(group.index[1:], group["OrigRowNum"].to_numpy()[1:], group["customer"].iloc[1:]):
+            # Generate new unique customer ID
+            new_customer_id = f"{original_customer_id}_{suffix_counter:03d}"
+            suffix_counter += 1
+
+            # Update the customer ID in the dataframe
+            cleaned_df.loc[idx, "customer"] = new_customer_id
+
+            # Mark as corrected
+            corrected_cells[(idx, "customer")] = {
+                "row": int(orig_row),
+                "original": original_customer_id,
+                "corrected": new_customer_id,
+                "type": "Data-based Duplicate Rename",
+                "status": "Valid"
+            }
+
+            # Add error entry
+            errors.append({
+                "Row": orig_row,
+                "Column": "customer",
+                "Error": f"Data-based duplicate, renamed to {new_customer_id} (identical data to customer {first_customer_id})",
+                "Value": original_customer_id
+            })
 
-    # Clean up temporary column
-    cleaned_df.drop(columns=["temp_data_key"], inplace=True)
+            debug_print("Renamed customer %s to %s (OrigRowNum %s) - identical data to customer %s", original_customer_id, new_customer_id, orig_row, first_customer_id)
 
 def remove_full_row_duplicates(cleaned_df, errors, rows_to_remove, duplicate_removals, corrected_cells, flagged_cells):
     """Remove exact duplicate rows and intelligently handle customer duplicates based on speed/technology.
@@ -181,14 +178,14 @@ def remove_full_row_duplicates(cleaned_df, errors, rows_to_remove, duplicate_rem
                 "Technology": row.get('technology', '')
             })
 
-            debug_print(f"Removing exact duplicate: OrigRowNum {orig_row_num} (duplicate of row {first_occurrence_row})")
+            debug_print("Removing exact duplicate: OrigRowNum %s (duplicate of row %s)", orig_row_num, first_occurrence_row)
 
     # Remove exact duplicates
     cleaned_df = cleaned_df[cleaned_df['_temp_dup_check'] == False].copy()
     cleaned_df.drop(columns=['_temp_dup_check'], inplace=True)
 
     exact_dup_count = initial_row_count - len(cleaned_df)
-    debug_print(f"Removed {exact_dup_count} exact duplicate rows")
+    debug_print("Removed %s exact duplicate rows", exact_dup_count)
 
     # Step 2: Handle duplicate customer IDs with speed/technology ranking
     # Define technology priority (lower = better)
@@ -217,7 +214,7 @@ def remove_full_row_duplicates(cleaned_df, errors, rows_to_remove, duplicate_rem
             rows_to_keep_indices.extend(group.index.tolist())
         else:
             # Multiple rows for same customer - apply ranking logic
-            debug_print(f"Found {len(group)} rows for customer '{customer_id}' - applying speed/technology ranking")
+            debug_print("Found %s rows for customer '%s' - applying speed/technology ranking", len(group), customer_id)
 
             # Sort by: download (desc), upload (desc), tech_rank (asc), original index (asc)
             sorted_group = group.sort_values(
@@ -261,7 +258,7 @@ def remove_full_row_duplicates(cleaned_df, errors, rows_to_remove, duplicate_rem
                     "Technology": removed_row.get('technology', '')
                 })
 
-                debug_print(f"Removing duplicate customer row: OrigRowNum {removed_orig_num} - {reason}")
+                debug_print("Removing duplicate customer row: OrigRowNum %s - %s", removed_orig_num, reason)
 
     # Filter to keep only the selected rows
     cleaned_df = cleaned_df.loc[rows_to_keep_indices].copy()
@@ -274,16 +271,16 @@ def remove_full_row_duplicates(cleaned_df, errors, rows_to_remove, duplicate_rem
     cleaned_df.reset_index(drop=True, inplace=True)
 
     customer_dup_count = len(duplicate_removals) - exact_dup_count
-    debug_print(f"Removed {customer_dup_count} duplicate customer rows based on speed/technology ranking")
+    debug_print("Removed %s duplicate customer rows based on speed/technology ranking", customer_dup_count)
 
     final_row_count = len(cleaned_df)
     total_removed = initial_row_count - final_row_count
 
-    debug_print(f"=== Duplicate removal complete ===")
-    debug_print(f"Initial rows: {initial_row_count}")
-    debug_print(f"Exact duplicates removed: {exact_dup_count}")
-    debug_print(f"Customer duplicates removed: {customer_dup_count}")
-    debug_print(f"Final rows: {final_row_count}")
-    debug_print(f"Total removed: {total_removed}")
+    debug_print("=== Duplicate removal complete ===")
+    debug_print("Initial rows: %s", initial_row_count)
+    debug_print("Exact duplicates removed: %s", exact_dup_count)
+    debug_print("Customer duplicates removed: %s", customer_dup_count)
+    debug_print("Final rows: %s", final_row_count)
+    debug_print("Total removed: %s", total_removed)
 
     return cleaned_df
\ No newline at end of file
@@ -1,9 +1,9 @@
 """General column validation functions."""
 
-import re
+import numpy as np
 import pandas as pd
 # Removed uszipcode import due to SQLAlchemy compatibility issues
-from src.config.settings import VALID_STATES, VALID_TECHNOLOGIES, FORBIDDEN_CHARS
+from src.config.settings import is_valid_state, VALID_TECHNOLOGIES, VALID_TECHNOLOGIES_ORDERED, contains_forbidden, ZIP_CODE_RE, ZIP9_RE
 from src.utils.logging import debug_print
 
 def append_general_error_with_tracking(error_msg, orig_row, col_name, value, idx, errors, flagged_cells):
@@ -21,12 +21,12 @@ def append_general_error_with_tracking(error_msg, orig_row, col_name, value, idx
         
         # Store OrigRowNum with the flagged cell (new format)
         flagged_cells[(idx, col_name)] = (error_msg, orig_row)
-        debug_print(f"General validation error for OrigRowNum={orig_row}, col={col_name}: {error_msg}")
+        debug_print("General validation error for OrigRowNum=%s, col=%s: %s", orig_row, col_name, error_msg)
 
 
 def get_state_from_zip(zip_code):
     """Get state abbreviation from ZIP code using a lookup dictionary."""
-    if not zip_code or not re.match(r"^\d{5}(-\d{4})?$", str(zip_code)):
+    if not zip_code or not ZIP_CODE_RE.match(str(zip_code)):
         return None
     
     # Extract 5-digit ZIP code
@@ -160,7 +160,7 @@ def get_state_from_zip(zip_code):
             
         return None
     except Exception as e:
-        debug_print(f"Error getting state from ZIP {zip_code}: {str(e)}")
+        debug_print("Error getting state from ZIP %s: %s", zip_code, str(e))
         return None
 
 def validate_and_correct_state(state_val, zip_val, idx, orig_row, errors, corrected_cells, flagged_cells):
@@ -177,13 +177,13 @@ def validate_and_correct_state(state_val, zip_val, idx, orig_row, errors, correc
                 "type": "State from ZIP Code",
                 "status": "Valid"
             }
-            debug_print(f"Filled missing state from ZIP for OrigRowNum={orig_row}: ZIP {zip_val} → {corrected_state}")
+            debug_print("Filled missing state from ZIP for OrigRowNum=%s: ZIP %s → %s", orig_row, zip_val, corrected_state)
             return corrected_state
         else:
             append_general_error_with_tracking("Required field: State cannot be empty", orig_row, "state", state_val, idx, errors, flagged_cells)
             return state_val
 
-    if state_val.upper() not in VALID_STATES:
+    if not is_valid_state(state_val):
         append_general_error_with_tracking("Invalid State Abbreviation", orig_row, "state", state_val, idx, errors, flagged_cells)
         corrected_state = get_state_from_zip(zip_val)
         if corrected_state:
@@ -204,7 +204,7 @@ def validate_and_correct_state(state_val, zip_val, idx, orig_row, errors, correc
             "type": "State Abbreviation Case Correction",
             "status": "Valid"
         }
-        debug_print(f"Corrected state case for OrigRowNum={orig_row}: '{state_val}' -> '{state_val.upper()}'")
+        debug_print("Corrected state case for OrigRowNum=%s: '%s' -> '%s'", orig_row, state_val, state_val.upper())
         return state_val.upper()
     return state_val
 
@@ -224,6 +224,19 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
 
     # Define required columns (all except lat/lon which can be empty)
     REQUIRED_COLUMNS = ["customer", "address", "city", "state", "zip", "download", "upload", "voip_lines_quantity", "business_customer", "technology"]
+    # OrigRowNum is never modified here, so read it once instead of per cell
+    orig_rows = cleaned_df["OrigRowNum"].to_numpy()
+    # Whether each address field is empty does not change during this pass (blank values only become
+    # NA), so it is computed column-wise once instead of reading the whole row for each cell
+    address_field_empty = {}
+    for field in ["address", "city", "state", "zip"]:
+        if field in cleaned_df.columns:
+            field_values = cleaned_df[field]
+            address_field_empty[field] = (field_values.isna() | field_values.astype(str).str.strip().eq("")).to_numpy()
+        else:
+            address_field_empty[field] = np.ones(len(cleaned_df), dtype=bool)
+    gps_only = (address_field_empty["address"] & address_field_empty["city"] &
+                address_field_empty["state"] & address_field_empty["zip"])
 
     for col in cleaned_df.columns:
         if col in ["OrigRowNum", "lat", "lon"]:
@@ -235,44 +248,37 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
             is_blank = values == ""
             for idx, (val, blank) in enumerate(zip(values, is_blank)):
                 if blank:
-                    orig_row = cleaned_df["OrigRowNum"][idx]
+                    orig_row = orig_rows[idx]
 
                     # Skip required field errors for address fields if ALL address fields are empty (GPS-only row)
                     if col in ["address", "city", "state", "zip"]:
-                        row_data = cleaned_df.iloc[idx]
-                        address_empty = pd.isna(row_data.get('address', '')) or str(row_data.get('address', '')).strip() == ""
-                        city_empty = pd.isna(row_data.get('city', '')) or str(row_data.get('city', '')).strip() == ""
-                        state_empty = pd.isna(row_data.get('state', '')) or str(row_data.get('state', '')).strip() == ""
-                        zip_empty = pd.isna(row_data.get('zip', '')) or str(row_data.get('zip', '')).strip() == ""
-
-                        if address_empty and city_empty and state_empty and zip_empty:
-                            debug_print(f"Skipping required field error for {col} at OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
+                        if gps_only[idx]:
+                            debug_print("Skipping required field error for %s at OrigRowNum=%s: All address fields empty (GPS-only row)", col, orig_row)
                             continue
 
                     error_msg = f"Required field: {col.capitalize()} cannot be empty"
 
                     # NEW: For address fields (city, state, zip), check if Smarty can fill them in
                     if col in ["city", "state", "zip"]:
-                        row_data = cleaned_df.iloc[idx]
-                        has_address = pd.notna(row_data.get('address', '')) and str(row_data.get('address', '')).strip()
-                        has_city = pd.notna(row_data.get('city', '')) and str(row_data.get('city', '')).strip()
-                        has_state = pd.notna(row_data.get('state', '')) and str(row_data.get('state', '')).strip()
-                        has_zip = pd.notna(row_data.get('zip', '')) and str(row_data.get('zip', '')).strip()
+                        has_address = not address_field_empty["address"][idx]
+                        has_city = not address_field_empty["city"][idx]
+                        has_state = not address_field_empty["state"][idx]
+                        has_zip = not address_field_empty["zip"][idx]
 
                         can_smarty_fix = False
 
                         if col == "zip" and has_address and has_city and has_state:
                             # Smarty can fill in ZIP if we have address, city, state
                             can_smarty_fix = True
-                            debug_print(f"Flagged missing ZIP for Smarty processing: OrigRowNum={orig_row}")
+                            debug_print("Flagged missing ZIP for Smarty processing: OrigRowNum=%s", orig_row)
                         elif col == "city" and has_address and has_zip:
                             # Smarty can fill in city if we have address and ZIP
                             can_smarty_fix = True
-                            debug_print(f"Flagged missing city for Smarty processing: OrigRowNum={orig_row}")
+                            debug_print("Flagged missing city for Smarty processing: OrigRowNum=%s", orig_row)
                         elif col == "state" and has_address and has_zip:
                             # Smarty can fill in state if we have address and ZIP
                             can_smarty_fix = True
-                            debug_print(f"Flagged missing state for Smarty processing: OrigRowNum={orig_row}")
+                            debug_print("Flagged missing state for Smarty processing: OrigRowNum=%s", orig_row)
 
                         if can_smarty_fix:
                             # Flag for Smarty processing
@@ -292,7 +298,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
 
         # Column-specific validation for non-empty values
         for idx, val in enumerate(values):
-            orig_row = cleaned_df["OrigRowNum"][idx]
+            orig_row = orig_rows[idx]
 
             # Skip if we already flagged this as a required field error
             if (idx, col) in flagged_cells and isinstance(flagged_cells[(idx, col)], tuple) and flagged_cells[(idx, col)][0].startswith("Required field:"):
@@ -300,14 +306,8 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
 
             # Skip address field validation for GPS-only rows
             if col in ["address", "city", "state", "zip"]:
-                row_data = cleaned_df.iloc[idx]
-                address_empty = pd.isna(row_data.get('address', '')) or str(row_data.get('address', '')).strip() == ""
-                city_empty = pd.isna(row_data.get('city', '')) or str(row_data.get('city', '')).strip() == ""
-                state_empty = pd.isna(row_data.get('state', '')) or str(row_data.get('state', '')).strip() == ""
-                zip_empty = pd.isna(row_data.get('zip', '')) or str(row_data.get('zip', '')).strip() == ""
-
-                if address_empty and city_empty and state_empty and zip_empty:
-                    debug_print(f"Skipping {col} format validation for OrigRowNum={orig_row}: All address fields empty (GPS-only row)")
+                if gps_only[idx]:
+                    debug_print("Skipping %s format validation for OrigRowNum=%s: All address fields empty (GPS-only row)", col, orig_row)
                     continue
 
             if col == "customer":
@@ -315,24 +315,24 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                     append_general_error_with_tracking("Customer ID contains a comma", orig_row, col, val, idx, errors, flagged_cells)
 
             elif col == "city" and val:
-                if re.search(FORBIDDEN_CHARS, val):
+                if contains_forbidden(val):
                     append_general_error_with_tracking("City contains forbidden character", orig_row, col, val, idx, errors, flagged_cells)
 
             elif col == "zip" and val:
                 # Auto-correct 9-digit zip codes without hyphen (12345678 -> 12345-6789)
-                if re.match(r"^\d{9}$", val):
+                if ZIP9_RE.match(val):
                     corrected_zip = f"{val[:5]}-{val[5:]}"
                     cleaned_df.loc[idx, col] = corrected_zip
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": corrected_zip,
                         "type": "ZIP+4 Hyphen Addition",
                         "status": "Valid"
                     }
-                elif not re.match(r"^\d{5}(-\d{4})?$", val):
+                elif not ZIP_CODE_RE.match(val):
                     append_general_error_with_tracking("Invalid ZIP code format", orig_row, col, val, idx, errors, flagged_cells)
-                if re.search(FORBIDDEN_CHARS, val):
+                if contains_forbidden(val):
                     append_general_error_with_tracking("ZIP code contains forbidden character", orig_row, col, val, idx, errors, flagged_cells)
 
             elif col in ["download", "upload"] and val:
@@ -341,7 +341,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                     if float_val < 0:
                         cleaned_df.loc[idx, col] = pd.NA
                         corrected_cells[(idx, col)] = {
-                            "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                            "row": int(orig_rows[idx]),
                             "original": val,
                             "corrected": None,
                             "type": "Invalid Speed Replacement",
@@ -353,7 +353,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                 except ValueError:
                     cleaned_df.loc[idx, col] = pd.NA
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": None,
                         "type": "Invalid Speed Replacement",
@@ -369,7 +369,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                         cleaned_df.loc[idx, col] = int_val
                         if val != str(int_val):
                             corrected_cells[(idx, col)] = {
-                                "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                                "row": int(orig_rows[idx]),
                                 "original": val,
                                 "corrected": int_val,
                                 "type": "VoIP Lines Format Correction",
@@ -378,7 +378,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                     else:
                         cleaned_df.loc[idx, col] = pd.NA
                         corrected_cells[(idx, col)] = {
-                            "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                            "row": int(orig_rows[idx]),
                             "original": val,
                             "corrected": None,
                             "type": "Invalid VoIP Lines Replacement",
@@ -388,7 +388,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                 except ValueError:
                     cleaned_df.loc[idx, col] = pd.NA
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": None,
                         "type": "Invalid VoIP Lines Replacement",
@@ -402,7 +402,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                     cleaned_df.loc[idx, col] = 1
                     if normalized_val != "1":
                         corrected_cells[(idx, col)] = {
-                            "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                            "row": int(orig_rows[idx]),
                             "original": val,
                             "corrected": 1,
                             "type": "Business Customer Normalization",
@@ -412,7 +412,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                     cleaned_df.loc[idx, col] = 0
                     if normalized_val != "0":
                         corrected_cells[(idx, col)] = {
-                            "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                            "row": int(orig_rows[idx]),
                             "original": val,
                             "corrected": 0,
                             "type": "Business Customer Normalization",
@@ -421,7 +421,7 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                 elif normalized_val:
                     cleaned_df.loc[idx, col] = 0
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": 0,
                         "type": "Invalid Business Customer Replacement",
@@ -443,18 +443,18 @@ def validate_general_columns(cleaned_df, errors, corrected_cells, flagged_cells)
                     corrected_val = technology_corrections[normalized_val]
                     cleaned_df.loc[idx, col] = corrected_val
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": corrected_val,
                         "type": "Technology Auto-Correction",
                         "status": "Valid"
                     }
                 elif normalized_val not in VALID_TECHNOLOGIES:
-                    append_general_error_with_tracking(f"Invalid technology: {', '.join(VALID_TECHNOLOGIES)}", orig_row, col, val, idx, errors, flagged_cells)
+                    append_general_error_with_tracking(f"Invalid technology: {', '.join(VALID_TECHNOLOGIES_ORDERED)}", orig_row, col, val, idx, errors, flagged_cells)
                 elif normalized_val != val:
                     cleaned_df.loc[idx, col] = normalized_val
                     corrected_cells[(idx, col)] = {
-                        "row": int(cleaned_df["OrigRowNum"].iloc[idx]),
+                        "row": int(orig_rows[idx]),
                         "original": val,
                         "corrected": normalized_val,
                         "type": "Technology Case Normalization",
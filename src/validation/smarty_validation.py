@@ -13,7 +13,7 @@ SMARTY_API_URL = "https://us-street.api.smarty.com/street-address"
 from src.config.settings import (
     SMARTY_AUTH_ID, SMARTY_AUTH_TOKEN, SMARTY_USAGE_LOG_PATH, DEBUG_MODE,
     SMARTY_BATCH_SIZE, SMARTY_MIN_BATCH_SIZE, SMARTY_BATCH_TIMEOUT, SMARTY_BATCH_MAX_PAYLOAD_BYTES,
-    SMARTY_MAX_RETRIES, SMARTY_RATE_LIMIT_DELAY, SMARTY_TIMEOUT_SECONDS
+    SMARTY_MAX_RETRIES, SMARTY_RATE_LIMIT_DELAY, SMARTY_TIMEOUT_SECONDS, NON_STANDARD_ENDINGS_RE
 )
 from src.utils.logging import debug_print
 
@@ -567,7 +567,7 @@ def validate_with_smarty(address, city, state, zip_code):
                     'raw_response': None
                 }
             
-            debug_print(f"Smarty API JSON response: {json_response}")
+            debug_print("Smarty API JSON response: %s", json_response)
             
             # Handle empty response (no match found)
             if not json_response or len(json_response) == 0:
@@ -941,8 +941,7 @@ def process_smarty_corrections(cleaned_df, errors, corrected_cells, flagged_cell
 
                     # Post-process Smarty's corrected address to remove non-standard endings
                     corrected_address = smarty_result['corrected_address']
-                    from src.config.settings import NON_STANDARD_ENDINGS
-                    match = re.search(NON_STANDARD_ENDINGS, corrected_address, re.IGNORECASE)
+                    match = NON_STANDARD_ENDINGS_RE.search(corrected_address)
                     if match:
                         corrected_address = corrected_address[:match.start()].strip()
                         debug_print(f"Removed non-standard ending from Smarty result for OrigRowNum {candidate['orig_row']}: '{corrected_address}'")